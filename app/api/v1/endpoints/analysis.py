@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Dict, Any, List
+import asyncio
 from uuid import UUID
 from app.db.session import get_db
 from app.models.all_models import Resume, JobDescription, Analysis, UserProfile
@@ -45,7 +46,7 @@ async def parse_resume_file_endpoint(
     """
     try:
         parsed = await parse_resume_file(file)
-        ats_readiness = calculate_ats_readiness(parsed)
+        ats_readiness = await asyncio.to_thread(calculate_ats_readiness, parsed)
         return {"parsed": parsed, "ats_readiness": ats_readiness}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -106,7 +107,8 @@ async def compare_resume_job(
     )
     
     # Calculate ATS readiness against this specific JD
-    ats_analysis = calculate_ats_readiness(
+    ats_analysis = await asyncio.to_thread(
+        calculate_ats_readiness,
         resume.content_structured,
         {"required_skills": match_analysis.get("missing_skills", [])}
     )
@@ -181,7 +183,7 @@ async def get_ats_readiness(
         raise HTTPException(status_code=400, detail="Resume has no structured content")
     
     # Calculate fresh ATS readiness
-    ats_analysis = calculate_ats_readiness(resume.content_structured)
+    ats_analysis = await asyncio.to_thread(calculate_ats_readiness, resume.content_structured)
     
     # Update resume with latest analysis
     resume.heatmap_data = ats_analysis
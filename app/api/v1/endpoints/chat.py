@@ -1,4 +1,6 @@
+import json
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.db.session import get_db
@@ -16,6 +18,15 @@ class ChatResponse(BaseModel):
     response: str
     suggestions: list = []
 
+def _user_context(user: UserProfile) -> dict:
+    return {
+        "user_id": user.id,
+        "target_role": user.target_role,
+        "experience_level": user.experience_level,
+        "country": user.country,
+        "career_goal": user.career_goal
+    }
+
 @router.post("/chat", response_model=ChatResponse)
 async def career_chat(
     request: ChatRequest,
@@ -25,12 +36,7 @@ async def career_chat(
     """
     Career Copilot Chat - context-aware career advice.
     """
-    user_context = {
-        "target_role": current_user.target_role,
-        "experience_level": current_user.experience_level,
-        "country": current_user.country,
-        "career_goal": current_user.career_goal
-    }
+    user_context = _user_context(current_user)
     
     response = await ai_service.generate_career_advice(user_context, request.message)
     
@@ -53,3 +59,24 @@ async def career_chat(
         response=response,
         suggestions=suggestions[:3]
     )
+
+@router.post("/chat/stream")
+async def career_chat_stream(
+    request: ChatRequest,
+    db: Session = Depends(get_db),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    """
+    Career Copilot Chat streamed as server-sent events.
+    
+    Each event carries a text fragment as {"t": "..."}; the stream ends
+    with a "[DONE]" event.
+    """
+    user_context = _user_context(current_user)
+    
+    async def events():
+        async for delta in ai_service.stream_career_advice(user_context, request.message):
+            yield f"data: {json.dumps({'t': delta})}\n\n"
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -7,6 +7,7 @@ from app.services.ats_explainability import calculate_ats_readiness
 from app.models.all_models import Resume, UserProfile
 from app.schemas.resume import ResumeInDB, ResumeUpdate, ResumeUploadResponse
 from app.api.v1.endpoints.auth import get_current_user
+import asyncio
 import os
 import aiofiles
 
@@ -53,8 +54,8 @@ async def upload_resume(
         content = await file.read()
         await out_file.write(content)
     
-    # Calculate ATS readiness
-    ats_readiness = calculate_ats_readiness(parsed_data)
+    # Calculate ATS readiness (CPU-bound; keep it off the event loop)
+    ats_readiness = await asyncio.to_thread(calculate_ats_readiness, parsed_data)
     
     # Save to database
     db_resume = Resume(
@@ -0,0 +1,37 @@
+"""
+Shared Redis cache
+
+One pooled redis.asyncio client shared by every uvicorn/gunicorn worker
+process, used as the L2 tier behind the in-process LLM response cache so
+a hot prompt is paid for once per fleet rather than once per worker. It
+holds the cacheable completions (temperature at or below
+LLM_CACHE_MAX_TEMPERATURE), i.e. the validated job-match responses
+behind the analysis endpoints.
+Disabled (shared_redis is None) unless the redis package is installed
+and REDIS_URL is configured.
+"""
+from typing import Optional
+
+from app.core.config import settings
+
+try:
+    from redis.asyncio import Redis
+except ImportError:
+    Redis = None
+
+
+REDIS_MAX_CONNECTIONS = 50
+
+shared_redis: Optional["Redis"] = None
+if Redis is not None and settings.REDIS_URL:
+    shared_redis = Redis.from_url(
+        settings.REDIS_URL,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        decode_responses=True
+    )
+
+
+async def close_shared_redis() -> None:
+    """Close the pooled connections (called on application shutdown)"""
+    if shared_redis is not None:
+        await shared_redis.aclose()
@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     # AI
     OPENAI_API_KEY: Optional[str] = None
 
+    # Cache (optional - shared L2 cache for multi-worker deployments)
+    REDIS_URL: Optional[str] = None
+
     # Supabase (Optional - for Auth/Storage)
     SUPABASE_URL: Optional[str] = None
     SUPABASE_KEY: Optional[str] = None
@@ -0,0 +1,27 @@
+"""
+Shared HTTP client
+
+One pooled httpx.AsyncClient reused by every outbound API client, so
+requests share warm keep-alive connections instead of paying TCP/TLS
+setup per client instance. HTTP/2 is enabled when the h2 package is
+installed.
+"""
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+shared_http = httpx.AsyncClient(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(60.0)
+)
+
+
+async def close_shared_http() -> None:
+    """Close the pooled connections (called on application shutdown)"""
+    await shared_http.aclose()
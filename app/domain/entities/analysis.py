@@ -4,7 +4,7 @@ Analysis Domain Entities
 Core entities for analysis results and explanations.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
@@ -41,7 +41,7 @@ class ExplanationType(str, Enum):
     CONTEXT = "context"
 
 
-@dataclass
+@dataclass(slots=True)
 class Explanation:
     """
     Human-readable explanation with context.
@@ -87,9 +87,15 @@ class Explanation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
-    """Result of a single check/evaluation"""
+    """
+    Result of a single check/evaluation
+    
+    The explanation is either assigned directly or built on first access
+    from ``explanation_factory``, so callers that only read status/score
+    never pay for it.
+    """
     id: UUID = field(default_factory=uuid4)
     check_name: str = ""
     category: str = ""  # e.g., "formatting", "content", "keywords"
@@ -102,12 +108,27 @@ class CheckResult:
     score: Optional[int] = None  # 0-100 if applicable
     
     # Details
-    explanation: Explanation = field(default_factory=Explanation)
     sub_checks: List["CheckResult"] = field(default_factory=list)
+    explanation_factory: Optional[Callable[[], Explanation]] = field(
+        default=None, repr=False, compare=False
+    )
+    _explanation: Optional[Explanation] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     # Evidence
     evidence_items: List[str] = field(default_factory=list)
     
+    @property
+    def explanation(self) -> Explanation:
+        if self._explanation is None:
+            self._explanation = (self.explanation_factory or Explanation)()
+        return self._explanation
+    
+    @explanation.setter
+    def explanation(self, value: Explanation) -> None:
+        self._explanation = value
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": str(self.id),
@@ -164,7 +185,7 @@ class MatchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ATSEvaluation:
     """
     ATS (Applicant Tracking System) Readiness Evaluation
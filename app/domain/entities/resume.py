@@ -5,7 +5,7 @@ Pure domain objects representing resume concepts.
 No database or framework dependencies.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
@@ -277,6 +277,11 @@ class ResumeEntity:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     
+    # Lazily computed caches
+    _skills_lower: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     # Computed properties
     @property
     def total_experience_years(self) -> float:
@@ -291,6 +296,13 @@ class ResumeEntity:
         count += sum(len(proj.bullets) for proj in self.projects)
         return count
     
+    @property
+    def skills_lower(self) -> FrozenSet[str]:
+        """Casefolded skills for case-insensitive lookups (computed once)"""
+        if self._skills_lower is None:
+            self._skills_lower = frozenset(s.casefold() for s in self.skills)
+        return self._skills_lower
+    
     @property
     def skill_count(self) -> int:
         return len(self.skills)
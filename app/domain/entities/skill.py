@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 
@@ -334,11 +335,15 @@ SKILL_CATEGORIES: Dict[str, SkillCategory] = {
     "Data Science": SkillCategory.DOMAIN,
 }
 
+# Both helpers are pure and called many times per profile with a small set of
+# skill names, so results are memoized
+@lru_cache(maxsize=1024)
 def normalize_skill_name(skill: str) -> str:
     """Normalize skill name to canonical form"""
     lower = skill.lower().strip()
     return SKILL_ALIASES.get(lower, skill.title())
 
+@lru_cache(maxsize=1024)
 def get_skill_category(skill: str) -> SkillCategory:
     """Get category for a skill"""
     normalized = normalize_skill_name(skill)
@@ -17,6 +17,8 @@ import logging
 import os
 
 from app.core.config import settings
+from app.core.http import close_shared_http
+from app.core.cache import close_shared_redis
 from app.api.v1.api import api_router
 from app.db.session import engine, Base, SessionLocal
 from app.models import all_models  # Import models to register them
@@ -85,6 +87,8 @@ async def lifespan(app: FastAPI):
     # SHUTDOWN
     # =========================================================================
     logger.info("Application shutting down")
+    await close_shared_http()
+    await close_shared_redis()
 
 
 # =============================================================================
@@ -7,8 +7,11 @@ from typing import Callable, Dict, Any, Optional
 from datetime import datetime
 import uuid
 import time
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 from contextvars import ContextVar
 
@@ -40,10 +43,15 @@ class StructuredLogger:
         self.service_name = service_name
         self.logger = logging.getLogger(service_name)
         
-        # Configure JSON handler
+        # Configure JSON handler. Records are queued and written by a
+        # background thread so logging never blocks on stdout.
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(handler)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(log_queue, handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger.setLevel(logging.INFO)
     
     def _build_log_record(
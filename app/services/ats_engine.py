@@ -9,12 +9,17 @@ Key principles:
 - Confidence bands for each check
 - Recruiter-friendly recommendations
 """
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from uuid import uuid4
 
-from app.domain.entities.resume import ResumeEntity, ResumeBullet, BulletStrength
+from app.domain.entities.resume import ResumeEntity, ResumeBullet, BulletStrength, ExperienceEntry
 from app.domain.entities.analysis import (
     ATSEvaluation, CheckResult, Explanation,
     SignalStrength, ConfidenceLevel, ActionPriority, ExplanationType
@@ -35,6 +40,11 @@ class CheckStatus(str, Enum):
 MIN_SKILLS_COUNT = 5
 MIN_EXPERIENCE_BULLETS = 3
 MAX_BULLET_LENGTH = 200  # Characters
+MAX_BULLETS_PER_ROLE = 8
+
+# Batch evaluation: below this size, process pool startup outweighs the gain
+PARALLEL_BATCH_MIN = 4
+PARALLEL_BATCH_CHUNKSIZE = 8
 
 # Section importance weights (for internal scoring only)
 SECTION_WEIGHTS = {
@@ -45,6 +55,18 @@ SECTION_WEIGHTS = {
     "summary": 0.10
 }
 
+# Per-check weights for the internal score
+_CATEGORY_WEIGHTS = MappingProxyType({
+    "parsing": SECTION_WEIGHTS["personal_info"],
+    "formatting": 0.15,
+    "keywords": SECTION_WEIGHTS["experience"],
+    "sections": 0.15,
+    "readability": 0.15
+})
+
+# Fallback score for checks that don't report one (anything else scores 40)
+_STATUS_DEFAULT_SCORE = MappingProxyType({"pass": 100, "warning": 70})
+
 # Strong action verbs for bullets
 ACTION_VERBS = [
     "achieved", "administered", "analyzed", "built", "collaborated",
@@ -57,6 +79,66 @@ ACTION_VERBS = [
     "streamlined", "supervised", "transformed", "upgraded"
 ]
 
+# Any action verb appearing in a bullet (substring match, like `verb in text`)
+_ACTION_VERB_RE = re.compile("|".join(map(re.escape, ACTION_VERBS)))
+_METRIC_RE = re.compile(r"\d")
+
+class _BulletStats(NamedTuple):
+    """Per-resume bullet counters shared by the keyword and readability checks"""
+    total: int
+    with_verbs: int
+    with_metrics: int
+    too_long: int
+    first_crowded: Optional[ExperienceEntry]  # First position with too many bullets
+
+
+def _collect_bullet_stats(experience: List[ExperienceEntry]) -> _BulletStats:
+    """Classify every experience bullet in a single pass"""
+    total = 0
+    with_verbs = 0
+    with_metrics = 0
+    too_long = 0
+    first_crowded = None
+    
+    for exp in experience:
+        bullets = exp.bullets
+        total += len(bullets)
+        if first_crowded is None and len(bullets) > MAX_BULLETS_PER_ROLE:
+            first_crowded = exp
+        
+        for bullet in bullets:
+            text = bullet.text
+            with_verbs += _ACTION_VERB_RE.search(text.lower()) is not None
+            with_metrics += _METRIC_RE.search(text) is not None
+            too_long += len(text) > MAX_BULLET_LENGTH
+    
+    return _BulletStats(total, with_verbs, with_metrics, too_long, first_crowded)
+
+
+# Formatting check summary by status
+_FORMATTING_STATUS_TEXT = {
+    "pass": "Your resume uses ATS-friendly formatting.",
+    "warning": "Minor formatting improvements recommended.",
+    "fail": "Formatting issues may prevent ATS parsing."
+}
+
+# Readiness summary text, indexed by level ordinal: (summary, detail)
+_LEVEL_ORDINAL = {"excellent": 0, "good": 1, "needs_work": 2}
+_LEVEL_TEXT = (
+    (
+        "Your resume is well-optimized for ATS systems.",
+        "All critical checks passed. Your resume follows ATS best practices and should parse correctly in most systems.",
+    ),
+    (
+        "Your resume should pass most ATS filters with minor improvements.",
+        "Most checks passed with some areas for improvement. These optimizations can increase your match scores.",
+    ),
+    (
+        "Some changes are needed to improve ATS compatibility.",
+        "We found issues that may prevent your resume from being properly parsed or ranked by ATS systems.",
+    ),
+)
+
 # Formatting red flags
 FORMATTING_RED_FLAGS = [
     "tables",
@@ -91,18 +173,95 @@ class ATSSimulationEngine:
         Returns:
             ATSEvaluation with detailed checks and explanations
         """
+        job_skills_lower = [s.casefold() for s in job_skills] if job_skills else None
+        evaluation = self._run_checks(resume, job_skills_lower)
+        self._explain(evaluation)
+        return evaluation
+    
+    def batch_evaluate(
+        self,
+        resumes: Iterable[ResumeEntity],
+        job_skills: Optional[List[str]] = None,
+        min_internal_score: int = 0,
+        max_workers: Optional[int] = None
+    ) -> List[ATSEvaluation]:
+        """
+        Run ATS evaluation on many resumes against the same job.
+        
+        Job skills are normalized once for the whole batch. Resumes whose
+        internal score falls below ``min_internal_score`` keep their check
+        results but skip summary and detailed explanation generation.
+        
+        Evaluation is CPU-bound pure Python, so batches of at least
+        PARALLEL_BATCH_MIN resumes are spread across worker processes.
+        
+        Args:
+            resumes: Parsed resume entities
+            job_skills: Optional list of skills from target job
+            min_internal_score: Internal score gate for building explanations
+            max_workers: Worker process count (defaults to CPU count; 1 disables)
+            
+        Returns:
+            ATSEvaluation per resume, in input order
+        """
+        resumes = list(resumes)
+        job_skills_lower = [s.casefold() for s in job_skills] if job_skills else None
+        workers = max_workers or os.cpu_count() or 1
+        
+        if len(resumes) < PARALLEL_BATCH_MIN or workers <= 1:
+            return [
+                self._evaluate_gated(resume, job_skills_lower, min_internal_score)
+                for resume in resumes
+            ]
+        
+        worker = partial(
+            _evaluate_gated_worker,
+            job_skills_lower=job_skills_lower,
+            min_internal_score=min_internal_score
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(worker, resumes, chunksize=PARALLEL_BATCH_CHUNKSIZE))
+    
+    def _evaluate_gated(
+        self,
+        resume: ResumeEntity,
+        job_skills_lower: Optional[List[str]],
+        min_internal_score: int
+    ) -> ATSEvaluation:
+        """Evaluate one resume, explaining it only if it clears the score gate"""
+        evaluation = self._run_checks(resume, job_skills_lower)
+        if evaluation._internal_score >= min_internal_score:
+            self._explain(evaluation)
+        return evaluation
+    
+    def _run_checks(
+        self,
+        resume: ResumeEntity,
+        job_skills_lower: Optional[List[str]] = None
+    ) -> ATSEvaluation:
+        """Run all checks and derive readiness level and internal score"""
         evaluation = ATSEvaluation()
         
+        # One pass over every experience bullet, shared by keyword and readability checks
+        bullet_stats = _collect_bullet_stats(resume.experience)
+        
         # Run all checks
         evaluation.parsing_check = self._check_parsing(resume)
         evaluation.formatting_check = self._check_formatting(resume)
-        evaluation.keyword_check = self._check_keywords(resume, job_skills)
+        evaluation.keyword_check = self._check_keywords(resume, bullet_stats, job_skills_lower)
         evaluation.section_check = self._check_sections(resume)
-        evaluation.readability_check = self._check_readability(resume)
+        evaluation.readability_check = self._check_readability(resume, bullet_stats)
         
         # Determine overall readiness level
         evaluation.readiness_level = self._determine_readiness_level(evaluation)
         
+        # Internal score (not shown to users)
+        evaluation._internal_score = self._calculate_internal_score(evaluation)
+        
+        return evaluation
+    
+    def _explain(self, evaluation: ATSEvaluation) -> None:
+        """Populate issues and explanations on a checked evaluation"""
         # Collect primary issues
         evaluation.primary_issues = self._collect_primary_issues(evaluation)
         
@@ -111,11 +270,6 @@ class ATSSimulationEngine:
         
         # Generate detailed explanations
         evaluation.detailed_explanations = self._generate_detailed_explanations(evaluation)
-        
-        # Internal score (not shown to users)
-        evaluation._internal_score = self._calculate_internal_score(evaluation)
-        
-        return evaluation
     
     # =========================================================================
     # INDIVIDUAL CHECKS
@@ -172,20 +326,8 @@ class ATSSimulationEngine:
             result.passed = True
         
         result.evidence_items = detected_sections
-        
-        # Create explanation
-        result.explanation = Explanation(
-            explanation_type=ExplanationType.WHAT_WE_FOUND,
-            title="Section Detection",
-            summary=f"ATS detected {len(detected_sections)} out of 6 standard sections.",
-            detail=f"Detected: {', '.join(detected_sections)}" if detected_sections else "No sections clearly detected.",
-            signal_name="section_detection",
-            signal_value=len(detected_sections),
-            signal_strength=SignalStrength.STRONG if len(detected_sections) >= 4 else SignalStrength.MODERATE,
-            confidence=ConfidenceLevel.HIGH,
-            is_actionable=bool(issues),
-            action_text=f"Add or clarify: {', '.join(issues)}" if issues else None,
-            action_priority=ActionPriority.HIGH if critical_missing else ActionPriority.MEDIUM
+        result.explanation_factory = partial(
+            self._parsing_explanation, detected_sections, issues, bool(critical_missing)
         )
         
         return result
@@ -231,26 +373,8 @@ class ATSSimulationEngine:
             result.passed = True
         
         result.evidence_items = issues + warnings
-        
-        # Create explanation
-        status_text = {
-            "pass": "Your resume uses ATS-friendly formatting.",
-            "warning": "Minor formatting improvements recommended.",
-            "fail": "Formatting issues may prevent ATS parsing."
-        }
-        
-        result.explanation = Explanation(
-            explanation_type=ExplanationType.WHAT_WE_FOUND,
-            title="Format Compatibility",
-            summary=status_text[result.status],
-            detail="ATS systems work best with clean, single-column layouts without tables, images, or complex formatting.",
-            signal_name="formatting_safety",
-            signal_strength=SignalStrength.STRONG if result.status == "pass" else SignalStrength.WEAK,
-            confidence=ConfidenceLevel.MEDIUM,  # Can't fully verify without original file
-            confidence_reason="Analysis based on parsed text; original file formatting may differ.",
-            is_actionable=bool(issues or warnings),
-            action_text=issues[0] if issues else (warnings[0] if warnings else None),
-            action_priority=ActionPriority.HIGH if issues else ActionPriority.LOW
+        result.explanation_factory = partial(
+            self._formatting_explanation, result.status, issues, warnings
         )
         
         return result
@@ -258,41 +382,32 @@ class ATSSimulationEngine:
     def _check_keywords(
         self, 
         resume: ResumeEntity,
-        job_skills: Optional[List[str]] = None
+        bullet_stats: _BulletStats,
+        job_skills_lower: Optional[List[str]] = None
     ) -> CheckResult:
         """Check keyword usage and action verb strength"""
+        # Skill coverage if job skills provided
+        skill_coverage = None
+        if job_skills_lower:
+            user_skills_lower = resume.skills_lower
+            matched_count = sum(1 for s in job_skills_lower if s in user_skills_lower)
+            skill_coverage = matched_count / len(job_skills_lower) * 100
+        
+        # Nothing to analyze - reuse the canonical empty result
+        if bullet_stats.total == 0:
+            evidence = list(_EMPTY_KEYWORDS_RESULT.evidence_items)
+            if skill_coverage is not None:
+                evidence.append(f"{int(skill_coverage)}% skill match with job")
+            return replace(_EMPTY_KEYWORDS_RESULT, id=uuid4(), evidence_items=evidence)
+        
         result = CheckResult(
             check_name="Keyword & Action Verb Analysis",
             category="keywords"
         )
         
         # Analyze bullet points
-        total_bullets = 0
-        bullets_with_verbs = 0
-        bullets_with_metrics = 0
-        
-        for exp in resume.experience:
-            for bullet in exp.bullets:
-                total_bullets += 1
-                text_lower = bullet.text.lower()
-                
-                # Check for action verbs
-                if any(verb in text_lower for verb in ACTION_VERBS):
-                    bullets_with_verbs += 1
-                
-                # Check for metrics (numbers)
-                if re.search(r'\d+', bullet.text):
-                    bullets_with_metrics += 1
-        
-        verb_percentage = (bullets_with_verbs / total_bullets * 100) if total_bullets > 0 else 0
-        metric_percentage = (bullets_with_metrics / total_bullets * 100) if total_bullets > 0 else 0
-        
-        # Skill coverage if job skills provided
-        skill_coverage = None
-        if job_skills:
-            user_skills_lower = {s.lower() for s in resume.skills}
-            matched_skills = [s for s in job_skills if s.lower() in user_skills_lower]
-            skill_coverage = (len(matched_skills) / len(job_skills) * 100) if job_skills else 0
+        verb_percentage = bullet_stats.with_verbs / bullet_stats.total * 100
+        metric_percentage = bullet_stats.with_metrics / bullet_stats.total * 100
         
         # Determine status
         if verb_percentage >= 70 and metric_percentage >= 40:
@@ -315,20 +430,8 @@ class ATSSimulationEngine:
             evidence.append(f"{int(skill_coverage)}% skill match with job")
         
         result.evidence_items = evidence
-        
-        # Create explanation
-        result.explanation = Explanation(
-            explanation_type=ExplanationType.WHAT_WE_FOUND,
-            title="Impact Language",
-            summary=f"Your resume uses action verbs in {int(verb_percentage)}% of bullets and includes metrics in {int(metric_percentage)}%.",
-            detail="Strong resumes start bullets with action verbs (Led, Developed, Achieved) and include specific numbers to quantify impact. This helps both ATS keyword matching and recruiter engagement.",
-            signal_name="keyword_strength",
-            signal_value={"verb_pct": verb_percentage, "metric_pct": metric_percentage},
-            signal_strength=SignalStrength.STRONG if verb_percentage >= 70 else SignalStrength.MODERATE,
-            confidence=ConfidenceLevel.HIGH,
-            is_actionable=verb_percentage < 70 or metric_percentage < 40,
-            action_text="Strengthen bullets by starting with action verbs and adding specific metrics" if verb_percentage < 70 else None,
-            action_priority=ActionPriority.MEDIUM
+        result.explanation_factory = partial(
+            self._keywords_explanation, verb_percentage, metric_percentage
         )
         
         return result
@@ -378,25 +481,18 @@ class ATSSimulationEngine:
             evidence.append(f"Missing: {', '.join(missing_required)}")
         
         result.evidence_items = evidence
-        
-        # Create explanation
-        result.explanation = Explanation(
-            explanation_type=ExplanationType.WHAT_WE_FOUND,
-            title="Section Coverage",
-            summary=f"Your resume has {required_present} of {required_total} essential sections.",
-            detail="ATS systems expect standard sections: Contact Info, Experience, Education, and Skills. Missing sections may cause parsing issues or reduce match scores.",
-            signal_name="section_completeness",
-            signal_value=completeness_score,
-            signal_strength=SignalStrength.STRONG if completeness_score == 100 else SignalStrength.MODERATE,
-            confidence=ConfidenceLevel.HIGH,
-            is_actionable=bool(missing_required),
-            action_text=f"Add: {', '.join(missing_required)}" if missing_required else None,
-            action_priority=ActionPriority.HIGH if missing_required else ActionPriority.LOW
+        result.explanation_factory = partial(
+            self._sections_explanation,
+            required_present, required_total, completeness_score, missing_required
         )
         
         return result
     
-    def _check_readability(self, resume: ResumeEntity) -> CheckResult:
+    def _check_readability(
+        self,
+        resume: ResumeEntity,
+        bullet_stats: _BulletStats
+    ) -> CheckResult:
         """Check recruiter readability"""
         result = CheckResult(
             check_name="Recruiter Readability",
@@ -404,18 +500,10 @@ class ATSSimulationEngine:
         )
         
         issues = []
-        total_bullets = 0
-        long_bullets = 0
         
         # Check bullet length
-        for exp in resume.experience:
-            for bullet in exp.bullets:
-                total_bullets += 1
-                if len(bullet.text) > MAX_BULLET_LENGTH:
-                    long_bullets += 1
-        
-        if total_bullets > 0:
-            long_bullet_pct = (long_bullets / total_bullets) * 100
+        if bullet_stats.total > 0:
+            long_bullet_pct = (bullet_stats.too_long / bullet_stats.total) * 100
             if long_bullet_pct > 30:
                 issues.append(f"{int(long_bullet_pct)}% of bullets may be too long for quick scanning")
         
@@ -423,11 +511,10 @@ class ATSSimulationEngine:
         if len(resume.experience) > 10:
             issues.append("Consider condensing older roles - 10+ positions may overwhelm recruiters")
         
-        # Check bullet count per job
-        for exp in resume.experience:
-            if len(exp.bullets) > 8:
-                issues.append(f"Position at {exp.company} has {len(exp.bullets)} bullets - consider reducing to 5-6")
-                break  # Only flag once
+        # Check bullet count per job (only flag the first offender)
+        crowded = bullet_stats.first_crowded
+        if crowded is not None:
+            issues.append(f"Position at {crowded.company} has {len(crowded.bullets)} bullets - consider reducing to 5-6")
         
         # Determine status
         if not issues:
@@ -440,9 +527,99 @@ class ATSSimulationEngine:
         readability_score = max(0, 100 - (len(issues) * 15))
         result.score = readability_score
         result.evidence_items = issues if issues else ["Resume is well-structured for quick scanning"]
+        result.explanation_factory = partial(
+            self._readability_explanation, issues, readability_score
+        )
         
-        # Create explanation
-        result.explanation = Explanation(
+        return result
+    
+    # =========================================================================
+    # EXPLANATION BUILDERS
+    # =========================================================================
+    # Checks bind these to their local state via partial() and attach them as
+    # CheckResult.explanation_factory; they only run when an explanation is
+    # actually read. Static so the partials stay picklable for batch workers.
+    
+    @staticmethod
+    def _parsing_explanation(
+        detected_sections: List[str],
+        issues: List[str],
+        critical_missing: bool
+    ) -> Explanation:
+        return Explanation(
+            explanation_type=ExplanationType.WHAT_WE_FOUND,
+            title="Section Detection",
+            summary=f"ATS detected {len(detected_sections)} out of 6 standard sections.",
+            detail=f"Detected: {', '.join(detected_sections)}" if detected_sections else "No sections clearly detected.",
+            signal_name="section_detection",
+            signal_value=len(detected_sections),
+            signal_strength=SignalStrength.STRONG if len(detected_sections) >= 4 else SignalStrength.MODERATE,
+            confidence=ConfidenceLevel.HIGH,
+            is_actionable=bool(issues),
+            action_text=f"Add or clarify: {', '.join(issues)}" if issues else None,
+            action_priority=ActionPriority.HIGH if critical_missing else ActionPriority.MEDIUM
+        )
+    
+    @staticmethod
+    def _formatting_explanation(
+        status: str,
+        issues: List[str],
+        warnings: List[str]
+    ) -> Explanation:
+        return Explanation(
+            explanation_type=ExplanationType.WHAT_WE_FOUND,
+            title="Format Compatibility",
+            summary=_FORMATTING_STATUS_TEXT[status],
+            detail="ATS systems work best with clean, single-column layouts without tables, images, or complex formatting.",
+            signal_name="formatting_safety",
+            signal_strength=SignalStrength.STRONG if status == "pass" else SignalStrength.WEAK,
+            confidence=ConfidenceLevel.MEDIUM,  # Can't fully verify without original file
+            confidence_reason="Analysis based on parsed text; original file formatting may differ.",
+            is_actionable=bool(issues or warnings),
+            action_text=issues[0] if issues else (warnings[0] if warnings else None),
+            action_priority=ActionPriority.HIGH if issues else ActionPriority.LOW
+        )
+    
+    @staticmethod
+    def _keywords_explanation(verb_percentage: float, metric_percentage: float) -> Explanation:
+        return Explanation(
+            explanation_type=ExplanationType.WHAT_WE_FOUND,
+            title="Impact Language",
+            summary=f"Your resume uses action verbs in {int(verb_percentage)}% of bullets and includes metrics in {int(metric_percentage)}%.",
+            detail="Strong resumes start bullets with action verbs (Led, Developed, Achieved) and include specific numbers to quantify impact. This helps both ATS keyword matching and recruiter engagement.",
+            signal_name="keyword_strength",
+            signal_value={"verb_pct": verb_percentage, "metric_pct": metric_percentage},
+            signal_strength=SignalStrength.STRONG if verb_percentage >= 70 else SignalStrength.MODERATE,
+            confidence=ConfidenceLevel.HIGH,
+            is_actionable=verb_percentage < 70 or metric_percentage < 40,
+            action_text="Strengthen bullets by starting with action verbs and adding specific metrics" if verb_percentage < 70 else None,
+            action_priority=ActionPriority.MEDIUM
+        )
+    
+    @staticmethod
+    def _sections_explanation(
+        required_present: int,
+        required_total: int,
+        completeness_score: int,
+        missing_required: List[str]
+    ) -> Explanation:
+        return Explanation(
+            explanation_type=ExplanationType.WHAT_WE_FOUND,
+            title="Section Coverage",
+            summary=f"Your resume has {required_present} of {required_total} essential sections.",
+            detail="ATS systems expect standard sections: Contact Info, Experience, Education, and Skills. Missing sections may cause parsing issues or reduce match scores.",
+            signal_name="section_completeness",
+            signal_value=completeness_score,
+            signal_strength=SignalStrength.STRONG if completeness_score == 100 else SignalStrength.MODERATE,
+            confidence=ConfidenceLevel.HIGH,
+            is_actionable=bool(missing_required),
+            action_text=f"Add: {', '.join(missing_required)}" if missing_required else None,
+            action_priority=ActionPriority.HIGH if missing_required else ActionPriority.LOW
+        )
+    
+    @staticmethod
+    def _readability_explanation(issues: List[str], readability_score: int) -> Explanation:
+        return Explanation(
             explanation_type=ExplanationType.WHY_IT_MATTERS,
             title="Scan-ability",
             summary="Recruiters spend 6-7 seconds on initial resume scan." if not issues else f"Found {len(issues)} readability concerns.",
@@ -456,8 +633,6 @@ class ATSSimulationEngine:
             action_text=issues[0] if issues else None,
             action_priority=ActionPriority.LOW
         )
-        
-        return result
     
     # =========================================================================
     # AGGREGATION & SUMMARY
@@ -494,23 +669,13 @@ class ATSSimulationEngine:
     
     def _generate_summary(self, evaluation: ATSEvaluation) -> Explanation:
         """Generate overall summary explanation"""
-        level_descriptions = {
-            "excellent": "Your resume is well-optimized for ATS systems.",
-            "good": "Your resume should pass most ATS filters with minor improvements.",
-            "needs_work": "Some changes are needed to improve ATS compatibility."
-        }
-        
-        level_details = {
-            "excellent": "All critical checks passed. Your resume follows ATS best practices and should parse correctly in most systems.",
-            "good": "Most checks passed with some areas for improvement. These optimizations can increase your match scores.",
-            "needs_work": "We found issues that may prevent your resume from being properly parsed or ranked by ATS systems."
-        }
+        summary, detail = _LEVEL_TEXT[_LEVEL_ORDINAL[evaluation.readiness_level]]
         
         return Explanation(
             explanation_type=ExplanationType.WHAT_WE_FOUND,
             title="ATS Readiness Summary",
-            summary=level_descriptions[evaluation.readiness_level],
-            detail=level_details[evaluation.readiness_level],
+            summary=summary,
+            detail=detail,
             signal_name="overall_readiness",
             signal_value=evaluation.readiness_level,
             signal_strength=SignalStrength.STRONG if evaluation.readiness_level == "excellent" else SignalStrength.MODERATE,
@@ -537,34 +702,45 @@ class ATSSimulationEngine:
         IMPORTANT: This score should NEVER be shown to users.
         It's only for internal ranking/sorting purposes.
         """
-        checks = evaluation.get_all_checks()
-        
-        total_weight = sum(SECTION_WEIGHTS.values())
         weighted_score = 0
         
-        category_weights = {
-            "parsing": SECTION_WEIGHTS.get("personal_info", 0.20),
-            "formatting": 0.15,
-            "keywords": SECTION_WEIGHTS.get("experience", 0.35),
-            "sections": 0.15,
-            "readability": 0.15
-        }
-        
-        for check in checks:
-            weight = category_weights.get(check.category, 0.1)
-            
-            if check.status == "pass":
-                score = check.score if check.score else 100
-            elif check.status == "warning":
-                score = check.score if check.score else 70
-            else:
-                score = check.score if check.score else 40
-            
+        for check in evaluation.get_all_checks():
+            weight = _CATEGORY_WEIGHTS.get(check.category, 0.1)
+            score = check.score or _STATUS_DEFAULT_SCORE.get(check.status, 40)
             weighted_score += (score * weight)
         
         return int(weighted_score)
 
 
+# Keyword check result for resumes without any experience bullets.
+# Treat as read-only; _check_keywords hands out copies with fresh ids.
+_EMPTY_KEYWORDS_RESULT = CheckResult(
+    check_name="Keyword & Action Verb Analysis",
+    category="keywords",
+    passed=False,
+    status="fail",
+    score=0,
+    evidence_items=[
+        "0% of bullets use strong action verbs",
+        "0% of bullets include metrics"
+    ],
+    explanation_factory=partial(ATSSimulationEngine._keywords_explanation, 0, 0)
+)
+
+
+# The engine is stateless, so one shared instance serves all callers
+_ENGINE = ATSSimulationEngine()
+
+
+def _evaluate_gated_worker(
+    resume: ResumeEntity,
+    job_skills_lower: Optional[List[str]],
+    min_internal_score: int
+) -> ATSEvaluation:
+    """Process pool entry point for batch_evaluate (must be module-level)"""
+    return _ENGINE._evaluate_gated(resume, job_skills_lower, min_internal_score)
+
+
 # Backward compatibility function
 def calculate_ats_readiness(
     resume_json: Dict[str, Any],
@@ -583,7 +759,6 @@ def calculate_ats_readiness(
     if job_desc:
         job_skills = job_desc.get("required_skills", [])
     
-    engine = ATSSimulationEngine()
-    evaluation = engine.evaluate(resume, job_skills)
+    evaluation = _ENGINE.evaluate(resume, job_skills)
     
     return evaluation.to_dict()
@@ -1,4 +1,170 @@
-from typing import Dict, Any, List
+import hashlib
+import json
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Set, Tuple
+
+# Strong action verbs for bullets
+ACTION_VERBS = ("led", "developed", "managed", "created", "improved", "increased",
+                "decreased", "achieved", "implemented", "designed", "built", "launched")
+
+# All verbs merged into one pattern so each bullet is scanned once (substring match).
+# Matched against ASCII-lowercased UTF-8 bytes, which is cheaper than str.lower().
+# Bound .search methods so the per-bullet scan skips the attribute lookups.
+_HAS_ACTION_VERB = re.compile("|".join(ACTION_VERBS).encode()).search
+_HAS_ASCII_DIGIT = re.compile(rb"\d").search
+
+
+def _scan_bullet(bullet: str) -> Tuple[bool, bool]:
+    """Return (has_action_verb, has_digit) from a single UTF-8 encoding of the bullet"""
+    encoded = bullet.encode("utf-8", "ignore")
+    has_verb = _HAS_ACTION_VERB(encoded.lower()) is not None
+    has_digit = _HAS_ASCII_DIGIT(encoded) is not None
+    if not has_digit and len(encoded) != len(bullet):
+        # Non-ASCII text may still contain Unicode digits. str.isdigit also
+        # accepts forms like "²" and "①" that a \d search would miss
+        has_digit = any(map(str.isdigit, bullet))
+    return has_verb, has_digit
+
+
+@dataclass
+class ResumeView:
+    """
+    Read-only view of a resume_json, built once per analysis.
+    
+    Every helper reads from the same view instead of re-walking the
+    resume dict and its experience bullets.
+    """
+    personal_info: Dict[str, Any]
+    summary: Any
+    experience: List[Dict[str, Any]]
+    education: List[Any]
+    skills: List[str]
+    skills_lower: Set[str]
+    projects: List[Any]
+    all_bullets: List[str]
+    bullet_count: int
+    bullets_with_verbs: int
+    bullets_with_metrics: int
+    long_bullets: int  # Longer than ~2 lines (150 chars)
+    
+    @classmethod
+    def from_resume_json(cls, resume_json: Dict[str, Any]) -> "ResumeView":
+        experience = resume_json.get("experience") or []
+        skills = resume_json.get("skills") or []
+        all_bullets = [b for exp in experience for b in exp.get("bullets") or ()]
+        
+        # Tally per-bullet flags in the same pass instead of keeping mask lists
+        bullets_with_verbs = bullets_with_metrics = long_bullets = 0
+        for bullet in all_bullets:
+            has_verb, has_digit = _scan_bullet(bullet)
+            bullets_with_verbs += has_verb
+            bullets_with_metrics += has_digit
+            long_bullets += len(bullet) > 150
+        
+        return cls(
+            personal_info=resume_json.get("personal_info") or {},
+            summary=resume_json.get("summary"),
+            experience=experience,
+            education=resume_json.get("education") or [],
+            skills=skills,
+            skills_lower={s.lower() for s in skills},
+            projects=resume_json.get("projects") or [],
+            all_bullets=all_bullets,
+            bullet_count=len(all_bullets),
+            bullets_with_verbs=bullets_with_verbs,
+            bullets_with_metrics=bullets_with_metrics,
+            long_bullets=long_bullets
+        )
+
+
+# Result templates: constant fields are set once here and helpers overlay the
+# dynamic ones. Dynamic keys are listed as None so the key order is preserved.
+_SKILL_MATCH_BASE = MappingProxyType({
+    "status": None,
+    "coverage_percentage": None,
+    "matched_skills": None,
+    "missing_skills": None,
+    "total_skills_listed": None,
+    "explanation": None,
+    "what_this_means": "Higher skill match increases ATS ranking and recruiter interest.",
+    "action_needed": None,
+})
+_SKILL_COUNT_BASE = MappingProxyType({
+    "status": None,
+    "total_skills_listed": None,
+    "coverage_percentage": None,
+    "explanation": None,
+    "what_this_means": "Skills section helps ATS match your profile to job requirements.",
+    "action_needed": None,
+})
+_KEYWORDS_BASE = MappingProxyType({
+    "status": None,
+    "action_verb_usage": None,
+    "quantified_achievements": None,
+    "total_bullets": None,
+    "explanation": None,
+    "what_this_means": "Action verbs and numbers make your resume more impactful for both ATS and recruiters.",
+    "action_needed": None,
+})
+_FORMATTING_BASE = MappingProxyType({
+    "status": None,
+    "critical_issues": None,
+    "warnings": None,
+    "explanation": "Checking for ATS-breaking patterns (images, tables, graphics, unusual fonts).",
+    "what_this_means": None,
+    "action_needed": None,
+})
+_SECTIONS_BASE = MappingProxyType({
+    "status": None,
+    "completeness_score": None,
+    "has_required": None,
+    "missing_required": None,
+    "has_recommended": None,
+    "explanation": None,
+    "what_this_means": "Complete sections help ATS categorize your information correctly.",
+    "action_needed": None,
+})
+_READABILITY_BASE = MappingProxyType({
+    "status": None,
+    "readability_score": None,
+    "total_bullets": None,
+    "long_bullets": None,
+    "explanation": None,
+    "what_this_means": "Recruiters can quickly scan and understand your experience.",
+    "recruiter_tip": "First 10 seconds matter most. Lead with your strongest achievements.",
+    "action_needed": None,
+})
+
+# Status -> sub-score tables for the overall score (default applies to any other status)
+_PARSING_STATUS_SCORE = MappingProxyType({"pass": 100, "warning": 70})
+_FORMATTING_STATUS_SCORE = MappingProxyType({"pass": 90})
+_SECTIONS_STATUS_SCORE = MappingProxyType({"pass": 85})
+
+_PARSING_SECTIONS = ("Experience", "Skills", "Education", "Contact Info", "Summary")
+
+
+@lru_cache(maxsize=32)
+def _parsing_result(signature: Tuple[bool, ...]) -> Dict:
+    """Parsing check result for one presence pattern of _PARSING_SECTIONS (32 in total)"""
+    detected_sections = [name for name, present in zip(_PARSING_SECTIONS, signature) if present]
+    
+    score = len(detected_sections) * 20  # Max 100 for 5 sections
+    
+    return {
+        "status": "pass" if len(detected_sections) >= 3 else "warning",
+        "detected_sections": detected_sections,
+        "score": score,
+        "explanation": f"ATS detected {len(detected_sections)}/5 standard sections. Most systems successfully parse this format.",
+        "what_this_means": "Your resume structure is recognized by applicant tracking systems.",
+        "action_needed": "Consider adding missing standard sections" if len(detected_sections) < 4 else None
+    }
+
 
 class ATSExplainabilityService:
     """
@@ -10,54 +176,45 @@ class ATSExplainabilityService:
         """
         Returns a multi-dimensional ATS analysis with explanations.
         """
+        view = ResumeView.from_resume_json(resume_json)
+        
         result = {
-            "parsing_success": self._check_parsing(resume_json),
-            "skill_coverage": self._analyze_skill_coverage(resume_json, job_desc),
-            "keyword_alignment": self._check_keywords(resume_json, job_desc),
-            "formatting_risks": self._detect_formatting_issues(resume_json),
-            "recruiter_readability": self._assess_readability(resume_json),
-            "section_completeness": self._check_section_completeness(resume_json),
+            "parsing_success": self._check_parsing(view),
+            "skill_coverage": self._analyze_skill_coverage(view, job_desc),
+            "keyword_alignment": self._check_keywords(view, job_desc),
+            "formatting_risks": self._detect_formatting_issues(view),
+            "recruiter_readability": self._assess_readability(view),
+            "section_completeness": self._check_section_completeness(view),
             "overall_score": 0  # Will be calculated
         }
         
         # Calculate overall score based on sub-scores
-        scores = []
-        if result["parsing_success"]["status"] == "pass":
-            scores.append(100)
-        elif result["parsing_success"]["status"] == "warning":
-            scores.append(70)
-        else:
-            scores.append(40)
-        
-        scores.append(result["skill_coverage"].get("coverage_percentage", 0))
-        scores.append(90 if result["formatting_risks"]["status"] == "pass" else 60)
-        scores.append(85 if result["section_completeness"]["status"] == "pass" else 50)
+        scores = (
+            _PARSING_STATUS_SCORE.get(result["parsing_success"]["status"], 40),
+            result["skill_coverage"].get("coverage_percentage", 0),
+            _FORMATTING_STATUS_SCORE.get(result["formatting_risks"]["status"], 60),
+            _SECTIONS_STATUS_SCORE.get(result["section_completeness"]["status"], 50),
+        )
         
         result["overall_score"] = int(sum(scores) / len(scores))
         
         return result
     
-    def _check_parsing(self, resume_json: Dict) -> Dict:
-        detected_sections = []
-        if resume_json.get("experience"): detected_sections.append("Experience")
-        if resume_json.get("skills"): detected_sections.append("Skills")
-        if resume_json.get("education"): detected_sections.append("Education")
-        if resume_json.get("personal_info", {}).get("name"): detected_sections.append("Contact Info")
-        if resume_json.get("summary"): detected_sections.append("Summary")
-        
-        score = len(detected_sections) * 20  # Max 100 for 5 sections
+    def _check_parsing(self, view: ResumeView) -> Dict:
+        signature = (
+            bool(view.experience),
+            bool(view.skills),
+            bool(view.education),
+            bool(view.personal_info.get("name")),
+            bool(view.summary),
+        )
+        cached = _parsing_result(signature)
         
-        return {
-            "status": "pass" if len(detected_sections) >= 3 else "warning",
-            "detected_sections": detected_sections,
-            "score": score,
-            "explanation": f"ATS detected {len(detected_sections)}/5 standard sections. Most systems successfully parse this format.",
-            "what_this_means": "Your resume structure is recognized by applicant tracking systems.",
-            "action_needed": "Consider adding missing standard sections" if len(detected_sections) < 4 else None
-        }
+        # Copy so callers never mutate the memoized result
+        return {**cached, "detected_sections": list(cached["detected_sections"])}
     
-    def _analyze_skill_coverage(self, resume_json: Dict, job_desc: Dict = None) -> Dict:
-        user_skills = resume_json.get("skills", [])
+    def _analyze_skill_coverage(self, view: ResumeView, job_desc: Dict = None) -> Dict:
+        user_skills = view.skills
         
         # If job description provided, extract required skills
         if job_desc and "required_skills" in job_desc:
@@ -67,146 +224,171 @@ class ATSExplainabilityService:
             target_skills = []
         
         if target_skills:
-            matched_skills = [s for s in user_skills if s.lower() in [t.lower() for t in target_skills]]
-            coverage_pct = int((len(matched_skills) / len(target_skills) * 100)) if target_skills else 0
+            # Lowercase each side once; membership tests are then O(1)
+            target_lower_list = [t.lower() for t in target_skills]
+            target_lower = set(target_lower_list)
+            user_lower = view.skills_lower
+            
+            matched_skills = [s for s in user_skills if s.lower() in target_lower]
+            coverage_pct = int((len(matched_skills) / len(target_skills) * 100))
             
             return {
+                **_SKILL_MATCH_BASE,
                 "status": "pass" if coverage_pct >= 70 else "warning" if coverage_pct >= 50 else "action_required",
                 "coverage_percentage": coverage_pct,
                 "matched_skills": matched_skills,
-                "missing_skills": [s for s in target_skills if s.lower() not in [u.lower() for u in user_skills]],
+                "missing_skills": [
+                    s for s, s_lower in zip(target_skills, target_lower_list)
+                    if s_lower not in user_lower
+                ],
                 "total_skills_listed": len(user_skills),
                 "explanation": f"Your resume includes {len(matched_skills)}/{len(target_skills)} skills from the job description.",
-                "what_this_means": "Higher skill match increases ATS ranking and recruiter interest.",
                 "action_needed": "Add missing skills if you have them (be honest)" if coverage_pct < 70 else None
             }
         else:
             # General skill count assessment
             skill_count = len(user_skills)
             return {
+                **_SKILL_COUNT_BASE,
                 "status": "pass" if skill_count >= 5 else "warning",
                 "total_skills_listed": skill_count,
                 "coverage_percentage": min(100, skill_count * 10),
                 "explanation": f"Resume lists {skill_count} skills. Aim for 8-15 relevant skills.",
-                "what_this_means": "Skills section helps ATS match your profile to job requirements.",
                 "action_needed": "Add more relevant skills" if skill_count < 5 else None
             }
     
-    def _check_keywords(self, resume_json: Dict, job_desc: Dict = None) -> Dict:
+    def _check_keywords(self, view: ResumeView, job_desc: Dict = None) -> Dict:
         # Count keyword density in experience bullets
-        experience = resume_json.get("experience", [])
-        total_bullets = sum(len(exp.get("bullets", [])) for exp in experience)
-        
-        # Check for action verbs
-        action_verbs = ["led", "developed", "managed", "created", "improved", "increased", 
-                       "decreased", "achieved", "implemented", "designed", "built", "launched"]
-        
-        bullets_with_verbs = 0
-        bullets_with_metrics = 0
+        total_bullets = view.bullet_count
         
-        for exp in experience:
-            for bullet in exp.get("bullets", []):
-                bullet_lower = bullet.lower()
-                if any(verb in bullet_lower for verb in action_verbs):
-                    bullets_with_verbs += 1
-                if any(char.isdigit() for char in bullet):
-                    bullets_with_metrics += 1
+        bullets_with_verbs = view.bullets_with_verbs
+        bullets_with_metrics = view.bullets_with_metrics
         
         verb_percentage = int((bullets_with_verbs / total_bullets * 100)) if total_bullets > 0 else 0
         metric_percentage = int((bullets_with_metrics / total_bullets * 100)) if total_bullets > 0 else 0
         
         return {
+            **_KEYWORDS_BASE,
             "status": "pass" if verb_percentage >= 70 else "warning",
             "action_verb_usage": verb_percentage,
             "quantified_achievements": metric_percentage,
             "total_bullets": total_bullets,
             "explanation": f"{verb_percentage}% of bullets use strong action verbs. {metric_percentage}% include metrics.",
-            "what_this_means": "Action verbs and numbers make your resume more impactful for both ATS and recruiters.",
             "action_needed": "Start more bullets with action verbs and add quantifiable results" if verb_percentage < 70 else None
         }
     
-    def _detect_formatting_issues(self, resume_json: Dict) -> Dict:
+    def _detect_formatting_issues(self, view: ResumeView) -> Dict:
         issues = []
         warnings = []
         
         # Check contact info
-        personal_info = resume_json.get("personal_info", {})
+        personal_info = view.personal_info
         if not personal_info.get("email"):
             issues.append("Email address missing")
         if not personal_info.get("phone"):
             warnings.append("Phone number missing - consider adding")
         
         # Check experience bullets
-        experience = resume_json.get("experience", [])
-        for exp in experience:
+        for exp in view.experience:
             if not exp.get("bullets"):
                 warnings.append(f"No bullet points for {exp.get('company', 'a position')}")
         
         # Check education
-        education = resume_json.get("education", [])
-        if not education:
+        if not view.education:
             warnings.append("Education section empty or missing")
         
         status = "fail" if issues else ("warning" if warnings else "pass")
         
         return {
+            **_FORMATTING_BASE,
             "status": status,
             "critical_issues": issues,
             "warnings": warnings,
-            "explanation": "Checking for ATS-breaking patterns (images, tables, graphics, unusual fonts).",
             "what_this_means": "All text will be correctly extracted by parsing software." if status == "pass" else "Some content may not parse correctly.",
             "action_needed": issues[0] if issues else (warnings[0] if warnings else None)
         }
     
-    def _check_section_completeness(self, resume_json: Dict) -> Dict:
+    def _check_section_completeness(self, view: ResumeView) -> Dict:
         required_sections = ["personal_info", "experience", "education", "skills"]
         recommended_sections = ["summary", "projects"]
         
-        has_required = [section for section in required_sections if resume_json.get(section)]
-        has_recommended = [section for section in recommended_sections if resume_json.get(section)]
+        has_required, missing_required = [], []
+        for section in required_sections:
+            (has_required if getattr(view, section) else missing_required).append(section)
+        has_recommended = [section for section in recommended_sections if getattr(view, section)]
         
         completeness_score = int((len(has_required) / len(required_sections)) * 100)
         
         return {
+            **_SECTIONS_BASE,
             "status": "pass" if completeness_score == 100 else "warning",
             "completeness_score": completeness_score,
             "has_required": has_required,
-            "missing_required": [s for s in required_sections if s not in has_required],
+            "missing_required": missing_required,
             "has_recommended": has_recommended,
             "explanation": f"{len(has_required)}/{len(required_sections)} required sections present.",
-            "what_this_means": "Complete sections help ATS categorize your information correctly.",
-            "action_needed": f"Add {', '.join([s for s in required_sections if s not in has_required])}" if completeness_score < 100 else None
+            "action_needed": f"Add {', '.join(missing_required)}" if completeness_score < 100 else None
         }
     
-    def _assess_readability(self, resume_json: Dict) -> Dict:
-        experience = resume_json.get("experience", [])
-        total_bullets = sum(len(exp.get("bullets", [])) for exp in experience)
+    def _assess_readability(self, view: ResumeView) -> Dict:
+        total_bullets = view.bullet_count
         
-        # Check bullet length
-        long_bullets = 0
-        for exp in experience:
-            for bullet in exp.get("bullets", []):
-                if len(bullet) > 150:  # More than ~2 lines
-                    long_bullets += 1
+        # Check bullet length (more than ~2 lines)
+        long_bullets = view.long_bullets
         
         readability_score = 100 - (long_bullets / total_bullets * 50) if total_bullets > 0 else 50
         
         return {
+            **_READABILITY_BASE,
             "status": "pass" if readability_score >= 70 else "warning",
             "readability_score": int(readability_score),
             "total_bullets": total_bullets,
             "long_bullets": long_bullets,
             "explanation": f"Resume has {total_bullets} experience bullets. {long_bullets} may be too long for quick scanning.",
-            "what_this_means": "Recruiters can quickly scan and understand your experience.",
-            "recruiter_tip": "First 10 seconds matter most. Lead with your strongest achievements.",
             "action_needed": "Consider shortening some bullet points for better scannability" if long_bullets > 0 else None
         }
 
 ats_service = ATSExplainabilityService()
 
+# Analysis is deterministic in (resume_json, job_desc), so results are cached
+# by content hash. Entries are pickled so every hit unpickles a private copy
+# that callers are free to mutate (e.g. after storing it as heatmap_data)
+ATS_CACHE_MAXSIZE = 1024
+_ats_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_ats_cache_lock = threading.Lock()
+
+
+def _ats_cache_key(resume_json: Dict[str, Any], job_desc: Dict[str, Any] = None) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(resume_json, sort_keys=True, default=str).encode())
+    h.update(b"|")
+    h.update(json.dumps(job_desc or {}, sort_keys=True, default=str).encode())
+    return h.digest()
+
+
 def calculate_ats_readiness(resume_json: Dict[str, Any], job_desc: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Convenience function to calculate ATS readiness.
+    
+    Repeated calls for the same resume/job pair return the cached result.
     """
-    return ats_service.analyze_ats_readiness(resume_json, job_desc)
+    key = _ats_cache_key(resume_json, job_desc)
+    
+    with _ats_cache_lock:
+        cached = _ats_cache.get(key)
+        if cached is not None:
+            _ats_cache.move_to_end(key)
+    if cached is not None:
+        return pickle.loads(cached)
+    
+    result = ats_service.analyze_ats_readiness(resume_json, job_desc)
+    snapshot = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    
+    with _ats_cache_lock:
+        _ats_cache[key] = snapshot
+        _ats_cache.move_to_end(key)
+        if len(_ats_cache) > ATS_CACHE_MAXSIZE:
+            _ats_cache.popitem(last=False)
+    
+    return result
 
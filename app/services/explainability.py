@@ -8,17 +8,29 @@ results include:
 - How confident we are
 - What to do next
 """
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.domain.entities.analysis import (
     Explanation, ExplanationType, SignalStrength, 
     ConfidenceLevel, ActionPriority
 )
 
 
+# Enum-to-str tables for format_for_frontend (None maps to the UI default)
+_TYPE_STR = {m: m.value for m in ExplanationType}
+_STRENGTH_STR = {None: None, **{m: m.value for m in SignalStrength}}
+_CONFIDENCE_STR = {None: "medium", **{m: m.value for m in ConfidenceLevel}}
+_PRIORITY_STR = {None: None, **{m: m.value for m in ActionPriority}}
+
+
 # =============================================================================
 # EXPLANATION TEMPLATES
 # =============================================================================
@@ -114,6 +126,73 @@ EXPLANATION_TEMPLATES = {
 }
 
 
+def _bullet_suggestion(index: int) -> str:
+    missing = [
+        label for bit, label in (
+            (0b100, "action verb"),
+            (0b010, "specific metrics"),
+            (0b001, "clear outcome"),
+        )
+        if not index & bit
+    ]
+    return f"adding {' and '.join(missing)}" if missing else "more specifics"
+
+
+# Suggestion text indexed by (has_action_verb << 2) | (has_metrics << 1) | has_result
+_BULLET_SUGGESTIONS: Tuple[str, ...] = tuple(_bullet_suggestion(i) for i in range(8))
+
+
+def _frontend_payload(exp: Explanation) -> Dict[str, Any]:
+    return {
+        "type": _TYPE_STR[exp.explanation_type],
+        "title": exp.title,
+        "summary": exp.summary,
+        "detail": exp.detail,
+        "signal": {
+            "name": exp.signal_name,
+            "value": exp.signal_value,
+            "strength": _STRENGTH_STR[exp.signal_strength]
+        },
+        "confidence": {
+            "level": _CONFIDENCE_STR[exp.confidence],
+            "reason": exp.confidence_reason
+        },
+        "action": {
+            "needed": exp.is_actionable,
+            "text": exp.action_text,
+            "priority": _PRIORITY_STR[exp.action_priority]
+        } if exp.is_actionable else None
+    }
+
+
+class _CompiledTemplate(NamedTuple):
+    """Explanation template with its static strings resolved ahead of time"""
+    title: str
+    summary_template: str
+    detail: str  # Already includes the "Why this matters" paragraph
+
+
+def _compile_template(key: str, template: Dict[str, str]) -> _CompiledTemplate:
+    detail = template.get("detail", "")
+    why_matters = template.get("why_matters", "")
+    
+    # Append why_matters to detail if available
+    if why_matters:
+        detail = f"{detail}\n\n**Why this matters:** {why_matters}"
+    
+    return _CompiledTemplate(
+        title=template.get("title", key),
+        summary_template=template.get("summary_template", ""),
+        detail=detail
+    )
+
+
+_COMPILED_TEMPLATES: Dict[str, _CompiledTemplate] = {
+    key: _compile_template(key, template)
+    for key, template in EXPLANATION_TEMPLATES.items()
+}
+
+
 class ExplainabilityEngine:
     """
     Generates human-readable explanations for all analysis outputs.
@@ -127,7 +206,7 @@ class ExplainabilityEngine:
     """
     
     def __init__(self):
-        self.templates = EXPLANATION_TEMPLATES
+        self.templates = _COMPILED_TEMPLATES
     
     def create_explanation(
         self,
@@ -160,24 +239,18 @@ class ExplainabilityEngine:
         Returns:
             Fully populated Explanation object
         """
-        template = self.templates.get(template_key, {})
-        vars_dict = template_vars or {}
+        template = self.templates.get(template_key)
+        if template is None:
+            template = _compile_template(template_key, {})
         
         # Apply template variables
-        title = template.get("title", template_key)
-        summary = template.get("summary_template", "").format(**vars_dict)
-        detail = template.get("detail", "")
-        why_matters = template.get("why_matters", "")
-        
-        # Append why_matters to detail if available
-        if why_matters:
-            detail = f"{detail}\n\n**Why this matters:** {why_matters}"
+        summary = template.summary_template.format_map(template_vars or {})
         
         return Explanation(
             explanation_type=ExplanationType.WHAT_WE_FOUND,
-            title=title,
+            title=template.title,
             summary=summary,
-            detail=detail,
+            detail=template.detail,
             signal_name=signal_name,
             signal_value=signal_value,
             signal_strength=signal_strength,
@@ -195,10 +268,39 @@ class ExplainabilityEngine:
         total_required: int
     ) -> List[Explanation]:
         """Generate explanations for skill matching results"""
-        explanations = []
-        
         match_pct = int((len(matched_skills) / total_required * 100)) if total_required > 0 else 0
         
+        return self._skill_match_explanations(match_pct, missing_skills)
+    
+    def explain_skill_match_batch(
+        self,
+        matched_lists: List[List[str]],
+        missing_lists: List[List[str]],
+        totals: List[int]
+    ) -> List[List[Explanation]]:
+        """
+        Generate skill match explanations for many candidates at once.
+        
+        Returns one list per candidate, identical to calling
+        explain_skill_match for each of them.
+        """
+        match_pcts = [
+            int((len(matched) / total * 100)) if total > 0 else 0
+            for matched, total in zip(matched_lists, totals)
+        ]
+        
+        return [
+            self._skill_match_explanations(match_pct, missing)
+            for match_pct, missing in zip(match_pcts, missing_lists)
+        ]
+    
+    def _skill_match_explanations(
+        self,
+        match_pct: int,
+        missing_skills: List[str]
+    ) -> List[Explanation]:
+        explanations = []
+        
         # Overall match explanation
         if match_pct >= 80:
             template_key = "skill_match_strong"
@@ -246,9 +348,9 @@ class ExplainabilityEngine:
         """Generate explanation for a bullet point analysis"""
         
         # Determine bullet strength
-        strength_score = sum([has_action_verb, has_metrics, has_result])
+        index = (bool(has_action_verb) << 2) | (bool(has_metrics) << 1) | bool(has_result)
         
-        if strength_score == 3:
+        if index == 0b111:
             return self.create_explanation(
                 template_key="bullet_strength_strong",
                 template_vars={"impact_type": "measurable results"},
@@ -260,15 +362,7 @@ class ExplainabilityEngine:
             )
         
         # Determine what's missing
-        missing = []
-        if not has_action_verb:
-            missing.append("action verb")
-        if not has_metrics:
-            missing.append("specific metrics")
-        if not has_result:
-            missing.append("clear outcome")
-        
-        suggestion = f"adding {' and '.join(missing)}" if missing else "more specifics"
+        suggestion = _BULLET_SUGGESTIONS[index]
         
         return self.create_explanation(
             template_key="bullet_strength_weak",
@@ -386,31 +480,7 @@ class ExplainabilityEngine:
         
         Returns simplified structure optimized for UI rendering.
         """
-        formatted = []
-        
-        for exp in explanations:
-            formatted.append({
-                "type": exp.explanation_type.value,
-                "title": exp.title,
-                "summary": exp.summary,
-                "detail": exp.detail,
-                "signal": {
-                    "name": exp.signal_name,
-                    "value": exp.signal_value,
-                    "strength": exp.signal_strength.value if exp.signal_strength else None
-                },
-                "confidence": {
-                    "level": exp.confidence.value if exp.confidence else "medium",
-                    "reason": exp.confidence_reason
-                },
-                "action": {
-                    "needed": exp.is_actionable,
-                    "text": exp.action_text,
-                    "priority": exp.action_priority.value if exp.action_priority else None
-                } if exp.is_actionable else None
-            })
-        
-        return formatted
+        return [_frontend_payload(exp) for exp in explanations]
     
     def create_custom_explanation(
         self,
@@ -478,3 +548,15 @@ def explain_analysis_result(result: Dict[str, Any]) -> List[Explanation]:
         ))
     
     return explanations
+
+
+def to_json_bytes(explanations: List[Explanation]) -> bytes:
+    """
+    Serialize explanations in the frontend shape straight to JSON bytes.
+    
+    Uses orjson when it is installed and falls back to compact stdlib json.
+    """
+    payload = ExplainabilityEngine().format_for_frontend(explanations)
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
@@ -1,35 +1,48 @@
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 # In production, use libraries like reportlab (PDF) or python-docx (DOCX)
 
+# Exports are streamed to the client in chunks of this size
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 class ExportEngine:
     def __init__(self):
         pass
 
-    async def generate_pdf(self, resume_data: Dict[str, Any], template_config: Dict[str, Any]) -> bytes:
+    async def generate_pdf(self, resume_data: Dict[str, Any], template_config: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Generates a PDF based on the resume data and template configuration.
+
+        Yields the document in EXPORT_CHUNK_SIZE pieces so routes can return
+        it as a StreamingResponse(media_type="application/pdf").
         """
         # Mock PDF generation
         # In a real implementation, this would use ReportLab to draw text based on template_config layout
-        
+
         content = f"""
         RESUME: {resume_data.get('personal_info', {}).get('name', 'Unknown')}
         TEMPLATE: {template_config.get('name')}
-        
+
         SUMMARY:
         {resume_data.get('summary', '')}
-        
+
         EXPERIENCE:
         {len(resume_data.get('experience', []))} roles listed.
         """
-        
-        return content.encode('utf-8')
 
-    async def generate_docx(self, resume_data: Dict[str, Any], template_config: Dict[str, Any]) -> bytes:
+        for chunk in _chunks(content.encode('utf-8')):
+            yield chunk
+
+    async def generate_docx(self, resume_data: Dict[str, Any], template_config: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
-        Generates a DOCX file.
+        Generates a DOCX file, yielded in EXPORT_CHUNK_SIZE pieces.
         """
         # Mock DOCX generation
-        return b"Fake DOCX Content"
+        for chunk in _chunks(b"Fake DOCX Content"):
+            yield chunk
+
+def _chunks(data: bytes):
+    view = memoryview(data)
+    for start in range(0, len(view), EXPORT_CHUNK_SIZE):
+        yield bytes(view[start:start + EXPORT_CHUNK_SIZE])
 
 export_engine = ExportEngine()
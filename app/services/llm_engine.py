@@ -1,29 +1,171 @@
+import asyncio
+import hashlib
+import operator
 import json
+import math
 import os
-from typing import List, Dict, Any
+import re
+import time
+from array import array
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Tuple
 from app.core.config import settings
+from app.core.cache import shared_redis
+from app.middleware.observability import logger
+from app.services.ats_engine import ACTION_VERBS
 
-# OpenAI client
+# orjson is much faster for LLM payloads; stdlib json is the fallback
 try:
-    from openai import OpenAI
-    client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+
+def _parse_llm_json(content: str) -> Any:
+    """
+    Parse JSON returned by the model.
+    
+    On a decode error, retries after stripping markdown code fences, then
+    trailing commas (the most common LLM slips), instead of paying for
+    another completion.
+    """
+    try:
+        return _json_loads(content)
+    except ValueError:
+        pass
+    
+    unfenced = _CODE_FENCE_RE.sub("", content)
+    try:
+        return _json_loads(unfenced)
+    except ValueError:
+        return _json_loads(_TRAILING_COMMA_RE.sub(r"\1", unfenced))
+
+# OpenAI client (async, so LLM round trips do not block the event loop)
+try:
+    from openai import AsyncOpenAI
+    from app.core.http import shared_http
+    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=shared_http) if settings.OPENAI_API_KEY else None
 except ImportError:
     client = None
 
-class AIService:
-    def __init__(self):
-        self.client = client
-        self.model = "gpt-4o-mini"  # Cost-effective model
+# Exact-match response cache. The sampling temperature is part of the key.
+# The structured analysis calls (resume extraction at 0.1, job match at 0.3)
+# are cached, so an identical repeat request gets the earlier sample. Bullet
+# rewrites (0.4) and career advice (0.7) are always regenerated, so asking
+# again yields a different answer.
+LLM_CACHE_MAXSIZE = 2000
+LLM_CACHE_TTL_SECONDS = 3600
+LLM_CACHE_MAX_TEMPERATURE = 0.3
 
-    async def extract_resume_info(self, text: str) -> Dict[str, Any]:
-        """
-        Uses LLM to extract structured data from resume text.
-        """
-        if not self.client:
-            # Return mock data if OpenAI not configured
-            return self._mock_resume_extraction(text)
-        
-        prompt = f"""
+# Prompt input budgets. Counted in tokens when tiktoken is installed,
+# otherwise approximated in characters and cut at a word boundary.
+RESUME_TEXT_MAX_TOKENS = 3000
+RESUME_TEXT_MAX_CHARS = 4000
+JOB_DESC_MAX_TOKENS = 1500
+JOB_DESC_MAX_CHARS = 2000
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _truncate_for_prompt(text: str, max_tokens: int, max_chars: int) -> str:
+    """Trim text to the prompt budget without cutting through a token or word."""
+    if tiktoken is not None:
+        encoding = _token_encoding()
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+    
+    if len(text) <= max_chars:
+        return text
+    truncated = text[:max_chars]
+    boundary = max(truncated.rfind(" "), truncated.rfind("\n"))
+    return truncated[:boundary] if boundary > 0 else truncated
+
+# Prompt inputs at least this long are prepared (tokenized, truncated and
+# formatted) in a worker thread instead of on the event loop.
+PROMPT_OFFLOAD_MIN_CHARS = 8000
+
+
+async def _prepare_prompt(input_chars: int, build: Callable[..., Any], *args: Any) -> Any:
+    if input_chars >= PROMPT_OFFLOAD_MIN_CHARS:
+        return await asyncio.to_thread(build, *args)
+    return build(*args)
+
+# Semantic cache for career advice: a question whose embedding is close enough
+# to an earlier question from the same user, under the same profile, reuses
+# its answer. Answers are never shared between users.
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_PER_USER = 20
+SEMANTIC_CACHE_MAX_USERS = 500
+
+
+def _quantize_embedding(vector: List[float]) -> Optional[Tuple[array, float]]:
+    """
+    Scale an embedding into int8 (1 byte per dimension instead of a Python
+    float object) and return it with its norm, or None for a zero vector.
+    """
+    peak = max(map(abs, vector), default=0.0)
+    if not peak:
+        return None
+    scale = 127 / peak
+    quantized = array("b", [round(x * scale) for x in vector])
+    return quantized, math.sqrt(sum(map(operator.mul, quantized, quantized)))
+
+# Max in-flight requests for bulk realtime calls (rate-limit friendly)
+BULK_CONCURRENCY = 10
+
+# Bullets that already lead with an action verb and carry a quantified result
+# (42%, 3x, 10+, $2M) are returned as-is instead of being sent to the model
+_STRONG_BULLET_RE = re.compile(
+    r"\s*(?:%s)\b.*?(?:\d+(?:%%|x\b|\+)|\$\d)" % "|".join(ACTION_VERBS),
+    re.IGNORECASE
+)
+
+
+def _already_strong_result(bullet: str) -> Optional[Dict[str, Any]]:
+    if _STRONG_BULLET_RE.match(bullet) is None:
+        return None
+    return {
+        "original": bullet,
+        "improved": bullet,
+        "explanation": "Bullet already starts with a strong action verb and includes a quantified result",
+        "score_before": 90,
+        "score_after": 90
+    }
+
+# Prompt templates, filled with str.format_map. Bump PROMPT_VERSION on any
+# edit so cached responses for the old wording are not reused.
+PROMPT_VERSION = "v1"
+
+_EXTRACT_RESUME_PROMPT = """
 You are a resume parser. Extract the following information from the resume text and return ONLY valid JSON.
 
 Extract:
@@ -48,27 +190,274 @@ For each section (personal_info, summary, skills, experience, education, project
 Return ONLY the JSON object, no markdown formatting, no explanations.
 
 Resume Text:
-{text[:4000]}
+{text}
+
+JSON:"""
+
+# Stable parts first (instructions, then the job description shared by every
+# resume matched against it) so OpenAI can reuse the cached prefix.
+_JOB_MATCH_PROMPT = """
+You are a career advisor analyzing job fit. Compare the resume against this job description.
+
+Return JSON with:
+{{
+  "match_score": <0-100>,
+  "matching_skills": [<skills from resume that match JD>],
+  "missing_skills": [<skills in JD not in resume>],
+  "experience_fit": "<brief analysis of experience level fit>",
+  "recommendations": [<3-5 specific actionable suggestions>],
+  "confidence": "<high/medium/low>"
+}}
+
+Job Description:
+{job_desc}
+
+Resume Summary:
+- Skills: {skills}
+- Experience: {role_count} roles
+- Latest Role: {latest_role}
+
+JSON:"""
+
+_IMPROVE_BULLET_PROMPT = """
+You are a professional resume writer. Improve this bullet point to be more impactful.
+
+Original Bullet:
+"{bullet}"
+
+Context:
+- Role: {role}
+- Company: {company}
+
+Make it:
+1. Start with a strong action verb
+2. Include specific metrics/numbers if possible
+3. Show impact/results
+4. Be concise (1-2 lines)
+5. Use past tense (unless current role)
+
+Return JSON:
+{{
+  "improved": "<improved bullet point>",
+  "explanation": "<brief explanation of changes>",
+  "score_before": <0-100>,
+  "score_after": <0-100>,
+  "improvements": ["<specific improvement 1>", "<improvement 2>"]
+}}
 
 JSON:"""
 
+# Invariant persona and guidelines first, per-user context last, so the
+# shared prefix is eligible for OpenAI prompt caching.
+_CAREER_ADVICE_SYSTEM_PROMPT = """
+You are CareerCopilot, a calm, trustworthy, and intelligent career advisor.
+
+Guidelines:
+- Be honest and realistic, not overly optimistic
+- Provide specific, actionable advice
+- Explain your reasoning
+- Use simple, clear language
+- Be encouraging but truthful
+- Focus on what the user can control
+
+User Context:
+- Target Role: {target_role}
+- Experience Level: {experience_level}
+- Location: {country}
+- Career Goal: {career_goal}
+"""
+
+# Fused resume + job match + bullet rewrite, answered in one completion
+_RESUME_ANALYSIS_PROMPT = """
+You are a resume parser, career advisor and professional resume writer. From the resume text and job description below, return ONE JSON object with:
+
+- "resume": the structured resume (contact fields, summary, skills, experience with bullets, education, projects, certifications, languages)
+- "match": how well the resume fits the job (match_score 0-100, matching and missing skills, experience fit, 3-5 specific actionable recommendations, confidence)
+- "improved_bullets": rewrites of the {bullet_count} weakest experience bullets. Each rewrite starts with a strong action verb, includes specific metrics where possible, shows impact, stays within 1-2 lines and uses past tense unless the role is current.
+
+Job Description:
+{job_desc}
+
+Resume Text:
+{text}
+"""
+
+
+def _string_array() -> Dict[str, Any]:
+    return {"type": "array", "items": {"type": "string"}}
+
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    # Structured outputs require every property to be listed as required
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+RESUME_ANALYSIS_SCHEMA = _strict_object({
+    "resume": _strict_object({
+        "name": {"type": "string"},
+        "email": {"type": "string"},
+        "phone": {"type": "string"},
+        "linkedin": {"type": "string"},
+        "location": {"type": "string"},
+        "website": {"type": "string"},
+        "summary": {"type": "string"},
+        "skills": _string_array(),
+        "experience": {"type": "array", "items": _strict_object({
+            "company": {"type": "string"},
+            "role": {"type": "string"},
+            "start_date": {"type": "string"},
+            "end_date": {"type": "string"},
+            "location": {"type": "string"},
+            "bullets": _string_array(),
+            "is_current": {"type": "boolean"}
+        })},
+        "education": {"type": "array", "items": _strict_object({
+            "institution": {"type": "string"},
+            "degree": {"type": "string"},
+            "field": {"type": "string"},
+            "start_date": {"type": "string"},
+            "end_date": {"type": "string"},
+            "gpa": {"type": "string"},
+            "location": {"type": "string"}
+        })},
+        "projects": {"type": "array", "items": _strict_object({
+            "name": {"type": "string"},
+            "description": {"type": "string"},
+            "tech_stack": _string_array(),
+            "bullets": _string_array()
+        })},
+        "certifications": _string_array(),
+        "languages": _string_array()
+    }),
+    "match": _strict_object({
+        "match_score": {"type": "integer"},
+        "matching_skills": _string_array(),
+        "missing_skills": _string_array(),
+        "experience_fit": {"type": "string"},
+        "recommendations": _string_array(),
+        "confidence": {"type": "string", "enum": ["high", "medium", "low"]}
+    }),
+    "improved_bullets": {"type": "array", "items": _strict_object({
+        "original": {"type": "string"},
+        "improved": {"type": "string"},
+        "explanation": {"type": "string"},
+        "score_before": {"type": "integer"},
+        "score_after": {"type": "integer"},
+        "improvements": _string_array()
+    })}
+})
+
+_ADVICE_UNAVAILABLE_MESSAGE = "I'm sorry, I need an OpenAI API key configured to provide personalized career advice."
+
+class AIService:
+    def __init__(self):
+        self.client = client
+        self.model = "gpt-4o-mini"  # Cost-effective model
+        
+        # key -> (expires_at, response content)
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        
+        # key -> completion in flight, awaited by concurrent identical
+        # cacheable requests (e.g. a double-submitted job match from the
+        # analysis endpoints)
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        
+        # Prompt-cache effectiveness (cached prefix tokens reported by OpenAI)
+        self._prompt_tokens = 0
+        self._cached_prompt_tokens = 0
+        
+        # user id -> (context key, int8 question embedding, its norm, answer),
+        # oldest first; least recently active users are evicted first
+        self._semantic_cache: "OrderedDict[Any, deque[Tuple[str, array, float, str]]]" = OrderedDict()
+        self._semantic_hits = 0
+
+    async def extract_resume_info(self, text: str) -> Dict[str, Any]:
+        """
+        Uses LLM to extract structured data from resume text.
+        """
+        if not self.client:
+            # Return mock data if OpenAI not configured
+            return self._mock_resume_extraction(text)
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a precise resume parser that outputs only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
+            messages = await _prepare_prompt(len(text), self._resume_extraction_messages, text)
+            content = await self._chat_completion(
+                messages=messages,
                 temperature=0.1,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                validate=_parse_llm_json
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = _parse_llm_json(content)
             return result
         except Exception as e:
-            print(f"OpenAI API error: {e}")
+            logger.error("openai_call_failed", operation="extract_resume_info", model=self.model, error=str(e))
             return self._mock_resume_extraction(text)
 
+    async def extract_resume_info_batch(self, texts: List[str]) -> Optional[str]:
+        """
+        Submits resume extraction for many texts through the OpenAI Batch API.
+        
+        Batch requests complete within 24h at half the realtime price.
+        Returns the batch id (None if OpenAI is not configured); collect
+        results with poll_batch. Single uploads stay on extract_resume_info.
+        """
+        if not self.client:
+            return None
+        
+        lines = await asyncio.to_thread(self._batch_request_lines, texts)
+        
+        input_file = await self.client.files.create(
+            file=("resume_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def poll_batch(self, batch_id: str) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Collects the results of an extract_resume_info_batch submission.
+        
+        Returns None while the batch is still running (or if OpenAI is
+        not configured). Once complete, returns the parsed resumes in
+        submission order, with None for any item that failed.
+        """
+        if not self.client:
+            return None
+        
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return None
+        
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        if batch.output_file_id:
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                item = _json_loads(line)
+                index = int(item["custom_id"].rsplit("-", 1)[1])
+                try:
+                    body = item["response"]["body"]
+                    results[index] = _parse_llm_json(body["choices"][0]["message"]["content"])
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.warning("openai_batch_item_failed", batch_id=batch_id, custom_id=item["custom_id"], error=str(e))
+                    results[index] = None
+        
+        total = batch.request_counts.total if batch.request_counts else len(results)
+        return [results.get(i) for i in range(total)]
+
     async def analyze_job_match(self, resume_json: Dict, job_desc: str) -> Dict[str, Any]:
         """
         Compares resume JSON against Job Description text.
@@ -77,44 +466,28 @@ JSON:"""
         if not self.client:
             return self._mock_job_match()
         
-        prompt = f"""
-You are a career advisor analyzing job fit. Compare the resume against this job description.
-
-Resume Summary:
-- Skills: {', '.join(resume_json.get('skills', [])[:20])}
-- Experience: {len(resume_json.get('experience', []))} roles
-- Latest Role: {resume_json.get('experience', [{}])[0].get('role', 'N/A') if resume_json.get('experience') else 'N/A'}
-
-Job Description:
-{job_desc[:2000]}
-
-Return JSON with:
-{{
-  "match_score": <0-100>,
-  "matching_skills": [<skills from resume that match JD>],
-  "missing_skills": [<skills in JD not in resume>],
-  "experience_fit": "<brief analysis of experience level fit>",
-  "recommendations": [<3-5 specific actionable suggestions>],
-  "confidence": "<high/medium/low>"
-}}
-
-JSON:"""
+        prompt = _JOB_MATCH_PROMPT.format_map({
+            "job_desc": await _prepare_prompt(len(job_desc), _truncate_for_prompt, job_desc, JOB_DESC_MAX_TOKENS, JOB_DESC_MAX_CHARS),
+            "skills": ', '.join(resume_json.get('skills', [])[:20]),
+            "role_count": len(resume_json.get('experience', [])),
+            "latest_role": resume_json.get('experience', [{}])[0].get('role', 'N/A') if resume_json.get('experience') else 'N/A'
+        })
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a career advisor providing honest, constructive feedback."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                validate=_parse_llm_json
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = _parse_llm_json(content)
             return result
         except Exception as e:
-            print(f"OpenAI API error: {e}")
+            logger.error("openai_call_failed", operation="analyze_job_match", model=self.model, error=str(e))
             return self._mock_job_match()
 
     async def improve_bullet_point(self, bullet: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -122,6 +495,10 @@ JSON:"""
         Rewrites a bullet point to be more impactful.
         Returns improved version with explanation.
         """
+        strong = _already_strong_result(bullet)
+        if strong is not None:
+            return strong
+        
         if not self.client:
             return {
                 "original": bullet,
@@ -131,37 +508,14 @@ JSON:"""
                 "score_after": 50
             }
         
-        prompt = f"""
-You are a professional resume writer. Improve this bullet point to be more impactful.
-
-Original Bullet:
-"{bullet}"
-
-Context:
-- Role: {context.get('role', 'Unknown')}
-- Company: {context.get('company', 'Unknown')}
-
-Make it:
-1. Start with a strong action verb
-2. Include specific metrics/numbers if possible
-3. Show impact/results
-4. Be concise (1-2 lines)
-5. Use past tense (unless current role)
-
-Return JSON:
-{{
-  "improved": "<improved bullet point>",
-  "explanation": "<brief explanation of changes>",
-  "score_before": <0-100>,
-  "score_after": <0-100>,
-  "improvements": ["<specific improvement 1>", "<improvement 2>"]
-}}
-
-JSON:"""
+        prompt = _IMPROVE_BULLET_PROMPT.format_map({
+            "bullet": bullet,
+            "role": context.get('role', 'Unknown'),
+            "company": context.get('company', 'Unknown')
+        })
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a resume writing expert who improves bullet points."},
                     {"role": "user", "content": prompt}
@@ -170,11 +524,11 @@ JSON:"""
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = _parse_llm_json(content)
             result["original"] = bullet
             return result
         except Exception as e:
-            print(f"OpenAI API error: {e}")
+            logger.error("openai_call_failed", operation="improve_bullet_point", model=self.model, error=str(e))
             return {
                 "original": bullet,
                 "improved": bullet,
@@ -183,34 +537,102 @@ JSON:"""
                 "score_after": 50
             }
 
+    async def analyze_resume_for_job(
+        self,
+        text: str,
+        job_desc: str,
+        bullet_count: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Extracts the resume, scores it against the job and rewrites its
+        weakest bullets in a single completion.
+        
+        Replaces the extract -> match -> improve chain (three round trips,
+        resume text sent each time) when a job description is available.
+        Returns {"resume": ..., "match": ..., "improved_bullets": [...]}.
+        """
+        if not self.client:
+            return {
+                "resume": self._mock_resume_extraction(text),
+                "match": self._mock_job_match(),
+                "improved_bullets": []
+            }
+        
+        prompt = await _prepare_prompt(
+            len(text) + len(job_desc), self._resume_analysis_prompt, text, job_desc, bullet_count
+        )
+
+        try:
+            content = await self._chat_completion(
+                messages=[
+                    {"role": "system", "content": "You are a precise career assistant that outputs only valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": "resume_analysis", "schema": RESUME_ANALYSIS_SCHEMA, "strict": True}
+                },
+                validate=_parse_llm_json
+            )
+            
+            return _parse_llm_json(content)
+        except Exception as e:
+            logger.error("openai_call_failed", operation="analyze_resume_for_job", model=self.model, error=str(e))
+            return {
+                "resume": self._mock_resume_extraction(text),
+                "match": self._mock_job_match(),
+                "improved_bullets": []
+            }
+
+    async def improve_bullets_bulk(
+        self,
+        bullets: List[str],
+        contexts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Improves many bullet points concurrently.
+        
+        At most BULK_CONCURRENCY requests are in flight at once; rate-limit
+        retries with exponential backoff are handled by the OpenAI client.
+        Results are returned in input order. Bullets that are already strong
+        are screened out up front and never take a concurrency slot.
+        """
+        pairs = list(zip(bullets, contexts))
+        results = [_already_strong_result(bullet) for bullet, _ in pairs]
+        pending = [i for i, result in enumerate(results) if result is None]
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        
+        async def improve_one(bullet: str, context: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.improve_bullet_point(bullet, context)
+        
+        improved = await asyncio.gather(*(
+            improve_one(*pairs[i]) for i in pending
+        ))
+        for i, result in zip(pending, improved):
+            results[i] = result
+        return results
+
     async def generate_career_advice(self, user_context: Dict[str, Any], question: str) -> str:
         """
         Career Copilot Chat - context-aware conversational AI.
         """
         if not self.client:
-            return "I'm sorry, I need an OpenAI API key configured to provide personalized career advice."
+            return _ADVICE_UNAVAILABLE_MESSAGE
         
-        system_prompt = f"""
-You are CareerCopilot, a calm, trustworthy, and intelligent career advisor.
+        system_prompt = self._career_advice_system_prompt(user_context)
 
-User Context:
-- Target Role: {user_context.get('target_role', 'Not specified')}
-- Experience Level: {user_context.get('experience_level', 'Not specified')}
-- Location: {user_context.get('country', 'Not specified')}
-- Career Goal: {user_context.get('career_goal', 'Not specified')}
-
-Guidelines:
-- Be honest and realistic, not overly optimistic
-- Provide specific, actionable advice
-- Explain your reasoning
-- Use simple, clear language
-- Be encouraging but truthful
-- Focus on what the user can control
-"""
+        user_id = user_context.get("user_id")
+        context_key = hashlib.sha256(system_prompt.encode()).hexdigest()
+        embedding = await self._embed_question(question) if user_id is not None else None
+        if embedding is not None:
+            cached = self._semantic_lookup(user_id, context_key, embedding)
+            if cached is not None:
+                return cached
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            content = await self._chat_completion(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": question}
@@ -219,10 +641,286 @@ Guidelines:
                 max_tokens=500
             )
             
-            return response.choices[0].message.content
+            if embedding is not None:
+                self._semantic_store(user_id, context_key, embedding, content)
+            return content
         except Exception as e:
             return f"I apologize, I'm experiencing technical difficulties: {str(e)}"
 
+    async def stream_career_advice(self, user_context: Dict[str, Any], question: str) -> AsyncIterator[str]:
+        """
+        Streaming variant of generate_career_advice.
+        
+        Yields answer text as the model produces it, so chat clients see the
+        first tokens in a few hundred ms instead of after the full answer.
+        Semantic cache hits are yielded in one piece.
+        """
+        if not self.client:
+            yield _ADVICE_UNAVAILABLE_MESSAGE
+            return
+        
+        system_prompt = self._career_advice_system_prompt(user_context)
+
+        user_id = user_context.get("user_id")
+        context_key = hashlib.sha256(system_prompt.encode()).hexdigest()
+        embedding = await self._embed_question(question) if user_id is not None else None
+        if embedding is not None:
+            cached = self._semantic_lookup(user_id, context_key, embedding)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": question}
+                ],
+                temperature=0.7,
+                max_tokens=500,
+                stream=True
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            yield f"I apologize, I'm experiencing technical difficulties: {str(e)}"
+            return
+        
+        if embedding is not None and parts:
+            self._semantic_store(user_id, context_key, embedding, "".join(parts))
+
+    def _career_advice_system_prompt(self, user_context: Dict[str, Any]) -> str:
+        return _CAREER_ADVICE_SYSTEM_PROMPT.format_map({
+            "target_role": user_context.get('target_role', 'Not specified'),
+            "experience_level": user_context.get('experience_level', 'Not specified'),
+            "country": user_context.get('country', 'Not specified'),
+            "career_goal": user_context.get('career_goal', 'Not specified')
+        })
+
+    def _resume_extraction_messages(self, text: str) -> List[Dict[str, str]]:
+        prompt = _EXTRACT_RESUME_PROMPT.format_map({
+            "text": _truncate_for_prompt(text, RESUME_TEXT_MAX_TOKENS, RESUME_TEXT_MAX_CHARS)
+        })
+
+        return [
+            {"role": "system", "content": "You are a precise resume parser that outputs only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _resume_analysis_prompt(self, text: str, job_desc: str, bullet_count: int) -> str:
+        return _RESUME_ANALYSIS_PROMPT.format_map({
+            "bullet_count": bullet_count,
+            "job_desc": _truncate_for_prompt(job_desc, JOB_DESC_MAX_TOKENS, JOB_DESC_MAX_CHARS),
+            "text": _truncate_for_prompt(text, RESUME_TEXT_MAX_TOKENS, RESUME_TEXT_MAX_CHARS)
+        })
+
+    def _batch_request_lines(self, texts: List[str]) -> List[str]:
+        return [
+            json.dumps({
+                "custom_id": f"resume-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._resume_extraction_messages(text),
+                    "temperature": 0.1,
+                    "response_format": {"type": "json_object"}
+                }
+            })
+            for i, text in enumerate(texts)
+        ]
+
+    async def _chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        validate: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        Run a chat completion and return the message content.
+        
+        Requests at or below LLM_CACHE_MAX_TEMPERATURE are served from the
+        exact-match cache when the same model, messages, temperature and
+        options were seen before: the
+        in-process LRU first, then the shared Redis cache when configured.
+        Identical requests arriving while one is in flight share its result
+        instead of issuing their own API call.
+        
+        Only complete responses (finish_reason "stop") are cached, and only
+        once validate (e.g. _parse_llm_json) accepts them; a truncated or
+        malformed answer is returned to the caller but never reused.
+        """
+        if temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return await self._create_completion(messages, temperature, kwargs)
+        
+        key = self._cache_key(messages, temperature, kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            # Run as its own task so a cancelled caller doesn't abort the
+            # call for everyone else waiting on it
+            inflight = asyncio.ensure_future(self._fetch_and_cache(key, messages, temperature, kwargs, validate))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch_and_cache(
+        self,
+        key: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        options: Dict[str, Any],
+        validate: Optional[Callable[[str], Any]]
+    ) -> str:
+        content = await self._shared_cache_get(key)
+        if content is None:
+            choice = await self._create_choice(messages, temperature, options)
+            content = choice.message.content
+            if choice.finish_reason != "stop" or content is None:
+                return content
+            if validate is not None:
+                try:
+                    validate(content)
+                except ValueError:
+                    return content
+            await self._shared_cache_set(key, content)
+        self._cache_set(key, content)
+        return content
+
+    async def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        options: Dict[str, Any]
+    ) -> str:
+        choice = await self._create_choice(messages, temperature, options)
+        return choice.message.content
+
+    async def _create_choice(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        options: Dict[str, Any]
+    ) -> Any:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            **options
+        )
+        self._record_prompt_usage(response.usage)
+        return response.choices[0]
+
+    def _record_prompt_usage(self, usage: Any) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        
+        self._prompt_tokens += usage.prompt_tokens
+        self._cached_prompt_tokens += cached_tokens
+        logger.debug(
+            "prompt_cache_usage",
+            cached_tokens=cached_tokens,
+            prompt_tokens=usage.prompt_tokens,
+            overall_cached_ratio=round(self._cached_prompt_tokens / max(self._prompt_tokens, 1), 3)
+        )
+
+    def _cache_key(self, messages: List[Dict[str, str]], temperature: float, options: Dict[str, Any]) -> str:
+        payload = _canonical_json(
+            {
+                "prompt_version": PROMPT_VERSION,
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature,
+                "options": options
+            }
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._cache[key]
+            self._misses += 1
+            return None
+        
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    async def _shared_cache_get(self, key: str) -> Optional[str]:
+        if shared_redis is None:
+            return None
+        try:
+            return await shared_redis.get(f"llm:{PROMPT_VERSION}:{key}")
+        except Exception as e:
+            logger.warning("shared_cache_unavailable", operation="get", error=str(e))
+            return None
+
+    async def _shared_cache_set(self, key: str, content: str) -> None:
+        if shared_redis is None:
+            return
+        try:
+            await shared_redis.setex(f"llm:{PROMPT_VERSION}:{key}", LLM_CACHE_TTL_SECONDS, content)
+        except Exception as e:
+            logger.warning("shared_cache_unavailable", operation="set", error=str(e))
+
+    def _cache_set(self, key: str, content: str) -> None:
+        self._cache[key] = (time.monotonic() + LLM_CACHE_TTL_SECONDS, content)
+        self._cache.move_to_end(key)
+        if len(self._cache) > LLM_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    async def _embed_question(self, question: str) -> Optional[Tuple[array, float]]:
+        """Quantized embedding of a question and its norm, or None if embedding fails."""
+        try:
+            response = await self.client.embeddings.create(model=SEMANTIC_CACHE_MODEL, input=question)
+        except Exception as e:
+            logger.warning("openai_embedding_failed", model=SEMANTIC_CACHE_MODEL, error=str(e))
+            return None
+        
+        return _quantize_embedding(response.data[0].embedding)
+
+    def _semantic_lookup(self, user_id: Any, context_key: str, embedding: Tuple[array, float]) -> Optional[str]:
+        """Answer of this user's most similar cached question above the threshold, if any."""
+        entries = self._semantic_cache.get(user_id)
+        if not entries:
+            return None
+        
+        vector, norm = embedding
+        best_score = SEMANTIC_CACHE_THRESHOLD
+        best_answer = None
+        for key, cached_vector, cached_norm, answer in entries:
+            if key != context_key:
+                continue
+            score = sum(map(operator.mul, vector, cached_vector)) / (norm * cached_norm)
+            if score >= best_score:
+                best_score, best_answer = score, answer
+        
+        if best_answer is not None:
+            self._semantic_hits += 1
+        return best_answer
+
+    def _semantic_store(self, user_id: Any, context_key: str, embedding: Tuple[array, float], answer: str) -> None:
+        entries = self._semantic_cache.get(user_id)
+        if entries is None:
+            entries = self._semantic_cache[user_id] = deque(maxlen=SEMANTIC_CACHE_PER_USER)
+        self._semantic_cache.move_to_end(user_id)
+        entries.append((context_key, *embedding, answer))
+        if len(self._semantic_cache) > SEMANTIC_CACHE_MAX_USERS:
+            self._semantic_cache.popitem(last=False)
+
     def _mock_resume_extraction(self, text: str) -> Dict[str, Any]:
         """Fallback mock data when OpenAI is not available."""
         return {
@@ -1,10 +1,31 @@
+import asyncio
+import hashlib
 import re
 import json
-from typing import Dict, Any, List
+import pickle
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, BinaryIO, Dict, FrozenSet, List, Tuple
 from fastapi import UploadFile
-import PyPDF2
-from docx import Document
-from app.services.llm_engine import ai_service
+
+# Caps on extracted list sizes (enforced while collecting, not by slicing after)
+MAX_SKILLS = 30
+MAX_BULLETS_PER_JOB = 15
+MAX_FALLBACK_BULLETS = 25
+
+# Characters of extracted text kept on the parsed resume as raw_text
+RAW_TEXT_MAX_CHARS = 5000
+
+# Parsed results of recent uploads, keyed by content hash (re-uploads of the
+# same file skip extraction and heuristics entirely). Entries are pickled so
+# every hit unpickles a private copy that callers are free to mutate
+PARSE_CACHE_MAXSIZE = 256
+_parse_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+# Uploads are hashed in pieces of this size rather than read whole
+HASH_CHUNK_SIZE = 64 * 1024
 
 
 SECTION_HEADERS = {
@@ -19,51 +40,123 @@ SECTION_HEADERS = {
     "publications": ["publications", "research", "papers"],
 }
 
+# Header line (lowercased) -> section name; the first section listing a header wins
+_HEADER_TO_SECTION: Dict[str, str] = {}
+for _section, _headers in SECTION_HEADERS.items():
+    for _header in _headers:
+        _HEADER_TO_SECTION.setdefault(_header, _section)
+
+# Every section header plus other common ATS headings, for _is_heading
+# (which assumes none is longer than 40 characters)
+_HEADING_SET = frozenset(h for group in SECTION_HEADERS.values() for h in group) | {"contact"}
+
+# Precompiled patterns (the per-line loops below run these hundreds of times)
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+# Leading bullet glyphs stripped by _clean_bullet
+_BULLET_CHARS = "-•●◆■◦*"
+_BULLET_PREFIXES = tuple(_BULLET_CHARS)
+_DIGIT_RE = re.compile(r"\d")
+_NAME_WORD_RE = re.compile(r"^[A-Za-z.'-]+$")
+
+_LINKEDIN_RE = re.compile(r"(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9\-_%/]+", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"(https?://)?(www\.)?github\.com/[A-Za-z0-9\-_]+", re.IGNORECASE)
+# Every website match contains "<word char>.<two letters>"; the first such spot
+# locates where the leftmost match can start
+_WEBSITE_ANCHOR_RE = re.compile(r"[A-Za-z0-9\-]\.[A-Za-z]{2}")
+_WEBSITE_WORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-.")
+# The lookarounds keep the host from starting inside or ending before an
+# email's "@", so email addresses never produce a website match
+_WEBSITE_RE = re.compile(
+    r"(?<![@A-Za-z0-9._%+-])(https?://)?(www\.)?(?:[A-Za-z0-9\-]+\.)+[A-Za-z]{2,}(?![A-Za-z0-9\-@])"
+    r"(/[A-Za-z0-9\-._~:/?#[\]@!$&'()*+,;=%]*)?"
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+# City, State/Country (e.g., "San Francisco, CA" or "Mumbai, India")
+_LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+_LOCATION_HINT_RE = re.compile(r"\w+,\s*\w+")
+_LOCATION_SPAN_RE = re.compile(r"([\w\s]+,\s*[\w\s]+)")
+_LOC_PIPE_RE = re.compile(r"\w+,\s*\w+\s*\|")
+
+# Dates: "Jan 2020 - Present", "2020-2023", "January 2020 to Dec 2023"
+# "Month Year" and "present" tokens in one scan (the two can never overlap)
+_DATE_SCAN_RE = re.compile(
+    r'(?P<month_year>(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(?P<year>\d{4}))'
+    r'|(?P<present>\bpresent\b)',
+    re.IGNORECASE
+)
+_YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[\-–—to]+\s*(\d{4}|Present)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(\d{4})')
+# Any month/year token; job headers also accept "present"
+_DATE_TOKEN_RE = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4})\b", re.IGNORECASE)
+_JOB_DATE_RE = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4}|present)\b", re.IGNORECASE)
+
+# Action verbs that mark an experience line as a bullet, matched as whole words
+_ACTION_VERBS = frozenset({
+    "built", "developed", "led", "designed", "implemented", "improved", "reduced", "increased",
+    "optimized", "migrated", "engineered", "created", "managed", "coordinated", "established",
+    "delivered", "achieved", "accelerated", "innovated", "integrated", "automated", "scaled",
+    "streamlined", "enhanced"
+})
+_WORD_RE = re.compile(r"\w+")
+_ROLE_SPLIT_RE = re.compile(r"[—–-]{2,}|\sat\s")
+_COMMA_PIPE_RE = re.compile(r"[,|]")
+
+_GPA_RE = re.compile(r'GPA:?\s*(\d+\.\d+|\d+/\d+)', re.IGNORECASE)
+_DEGREE_RE = re.compile(r'\b(Bachelor|Master|MBA|PhD|B\.S\.|M\.S\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech|B\.E\.|M\.E\.)\b', re.IGNORECASE)
+_IN_SPLIT_RE = re.compile(r'\s+in\s+', re.IGNORECASE)
+
+_SKILL_SPLIT_RE = re.compile(r"[\n,|/]+")
+_TECH_SPLIT_RE = re.compile(r'[,|/]')
+_CERT_SPLIT_RE = re.compile(r'[-–—,|]')
+_LANG_SPLIT_RE = re.compile(r'[,\n|/]+')
+_PARENS_RE = re.compile(r'\(.*?\)')
+_PROFICIENCY_RE = re.compile(r'\b(native|fluent|proficient|intermediate|basic|elementary)\b', re.IGNORECASE)
+
 
 def _is_heading(line: str) -> bool:
     t = (line or "").strip()
-    if not t:
+    # Cheapest tests first: no known heading is longer than 40 characters
+    if not t or len(t) > 40:
         return False
-    low = t.lower()
-    if any(low == h for group in SECTION_HEADERS.values() for h in group):
-        return True
-    # Common ATS headings
-    if low in {"core skills", "core competencies", "professional experience", "work experience", "contact", "languages", "awards", "certifications"}:
-        return True
-    # All-caps short lines are usually headings
-    letters = re.sub(r"[^A-Za-z]", "", t)
-    if letters and t.upper() == t and len(t) <= 40:
+    if t.lower() in _HEADING_SET:
         return True
-    return False
+    # All-caps short lines (with at least one letter) are usually headings
+    return t.upper() == t and _ASCII_LETTER_RE.search(t) is not None
+
+
+def _heading_lines(lines: List[str]) -> FrozenSet[str]:
+    """Distinct lines of a document that _is_heading accepts."""
+    return frozenset(filter(_is_heading, set(lines)))
 
 
 def _clean_bullet(line: str) -> str:
-    t = (line or "").strip()
-    t = re.sub(r"^[\-•●◆■◦*\u2022]+\s*", "", t)
-    t = re.sub(r"\s+", " ", t)
-    return t.strip()
+    t = (line or "").strip().lstrip(_BULLET_CHARS)
+    # Collapse whitespace runs (and trim) in C rather than through the regex engine
+    return " ".join(t.split())
 
 
 def _extract_linkedin(text: str) -> str:
-    m = re.search(r"(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9\-_%/]+", text, re.IGNORECASE)
+    m = _LINKEDIN_RE.search(text)
     return m.group(0) if m else ""
 
 
 def _extract_github(text: str) -> str:
     """Extract GitHub profile URL."""
-    m = re.search(r"(https?://)?(www\.)?github\.com/[A-Za-z0-9\-_]+", text, re.IGNORECASE)
+    m = _GITHUB_RE.search(text)
     return m.group(0) if m else ""
 
 
 def _extract_website(text: str) -> str:
-    m = re.search(r"(https?://)?(www\.)?[A-Za-z0-9\-]+\.[A-Za-z]{2,}(/[A-Za-z0-9\-._~:/?#[\]@!$&'()*+,;=%]*)?", text)
-    if not m:
+    anchor = _WEBSITE_ANCHOR_RE.search(text)
+    if not anchor:
         return ""
-    url = m.group(0)
-    # avoid returning emails
-    if "@" in url:
-        return ""
-    return url
+    # Back up to the start of that host name, plus room for an "https://" prefix
+    start = anchor.start()
+    while start > 0 and text[start - 1] in _WEBSITE_WORD_CHARS:
+        start -= 1
+    m = _WEBSITE_RE.search(text, max(0, start - len("https://")))
+    return m.group(0) if m else ""
 
 
 def _split_lines(text: str) -> List[str]:
@@ -72,9 +165,7 @@ def _split_lines(text: str) -> List[str]:
 
 def _extract_location(text: str) -> str:
     """Extract location from resume (city, state/country format)."""
-    # Pattern: City, State/Country (e.g., "San Francisco, CA" or "Mumbai, India")
-    location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-    match = re.search(location_pattern, text)
+    match = _LOCATION_RE.search(text)
     if match:
         return match.group(0)
     return ""
@@ -82,27 +173,35 @@ def _extract_location(text: str) -> str:
 
 def _extract_dates(line: str) -> tuple:
     """Extract start_date and end_date from a line."""
-    # Patterns: "Jan 2020 - Present", "2020-2023", "January 2020 to Dec 2023"
-    # Format 1: Month Year - Month Year or Present
-    month_year_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})'
-    matches = re.findall(month_year_pattern, line, re.IGNORECASE)
+    month_years = []
+    has_present = False
+    for m in _DATE_SCAN_RE.finditer(line):
+        if m.lastgroup == "present":
+            has_present = True
+        else:
+            month_years.append(m)
+            if len(month_years) == 2:
+                # Start and end found; anything later can't change the result
+                break
     
-    if matches:
-        start_date = f"{matches[0][0]} {matches[0][1]}" if matches else ""
-        end_date = f"{matches[1][0]} {matches[1][1]}" if len(matches) > 1 else ""
-        if not end_date and re.search(r'\bpresent\b', line, re.IGNORECASE):
-            end_date = "Present"
+    # Format 1: Month Year - Month Year or Present
+    if month_years:
+        first = month_years[0]
+        start_date = f"{first['month']} {first['year']}"
+        if len(month_years) > 1:
+            end_date = f"{month_years[1]['month']} {month_years[1]['year']}"
+        else:
+            end_date = "Present" if has_present else ""
         return (start_date, end_date)
     
     # Format 2: YYYY - YYYY or YYYY-YYYY
-    year_pattern = r'(\d{4})\s*[\-–—to]+\s*(\d{4}|Present)'
-    year_match = re.search(year_pattern, line, re.IGNORECASE)
+    year_match = _YEAR_RANGE_RE.search(line)
     if year_match:
         return (year_match.group(1), year_match.group(2))
     
     # Format 3: Single year or "Present"
-    if re.search(r'\bpresent\b', line, re.IGNORECASE):
-        year_match = re.search(r'(\d{4})', line)
+    if has_present:
+        year_match = _YEAR_RE.search(line)
         if year_match:
             return (year_match.group(1), "Present")
     
@@ -131,6 +230,9 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
     text = raw_text or ""
     lines = _split_lines(text)
     joined = "\n".join(lines)
+    # Classify each distinct line once; the name, summary and section passes
+    # below all read from this instead of re-testing the same lines
+    headings = _heading_lines(lines)
 
     email = extract_email(joined)
     phone = extract_phone(joined)
@@ -151,9 +253,9 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                     if j < 0:
                         break
                     cand = lines[j]
-                    if _is_heading(cand):
+                    if cand in headings:
                         continue
-                    if re.search(r"\d", cand):
+                    if _DIGIT_RE.search(cand):
                         continue
                     if 2 <= len(cand.split()) <= 5:
                         name = cand.strip()
@@ -161,37 +263,34 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 break
 
     if not name:
-        for ln in lines[:40]:
-            if _is_heading(ln):
-                continue
-            if email and email.lower() in ln.lower():
-                continue
-            if phone and phone in ln:
+        # Cheapest checks first. Name words are letters and .'- only, which
+        # also rules out lines holding a digit, the email or the phone number
+        for ln in islice(lines, 40):
+            if ln in headings:
                 continue
-            if re.search(r"\d", ln):
-                continue
-            words = [w for w in re.split(r"\s+", ln.strip()) if w]
+            words = ln.split()
             if not (2 <= len(words) <= 5):
                 continue
-            if not all(re.match(r"^[A-Za-z.'-]+$", w) for w in words):
+            if not all(_NAME_WORD_RE.match(w) for w in words):
                 continue
-            name = ln.strip()
+            name = ln
             break
 
-    sections = extract_sections(text)
+    # section name -> its (stripped, non-empty) lines
+    sections = extract_sections(lines)
 
     # Summary: extract clean professional summary, skip location/date lines
-    summary = (sections.get("summary") or "").strip()
-    if summary:
+    summary = ""
+    summary_lines = sections.get("summary") or []
+    if summary_lines:
         # Clean up summary: remove location/date lines
-        summary_lines = _split_lines(summary)
         clean_summary = []
         for ln in summary_lines:
             # Skip lines with dates like "Jan 2022" or "2022-Present"
-            if re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4})\b", ln, re.IGNORECASE):
+            if _DATE_TOKEN_RE.search(ln):
                 continue
             # Skip lines with location patterns like "City, Country |"
-            if re.search(r"\w+,\s*\w+\s*\|", ln):
+            if _LOC_PIPE_RE.search(ln):
                 continue
             # Skip very short lines (likely headers/dates)
             if len(ln) < 20:
@@ -205,14 +304,14 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
         # fallback: first ~2-3 substantial lines that look like summary
         summary_candidates: List[str] = []
         for ln in lines[:80]:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             if len(ln) < 40:
                 continue
             # Skip date/location patterns
-            if re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4})\b", ln, re.IGNORECASE):
+            if _DATE_TOKEN_RE.search(ln):
                 continue
-            if re.search(r"\w+,\s*\w+\s*\|", ln):
+            if _LOC_PIPE_RE.search(ln):
                 continue
             summary_candidates.append(ln)
             if len(summary_candidates) >= 3:
@@ -220,11 +319,11 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
         summary = " ".join(summary_candidates).strip()
 
     # Skills
-    skills_text = sections.get("skills") or ""
+    skills_lines = sections.get("skills") or []
     skills: List[str] = []
-    if skills_text:
-        # split on commas/newlines/bullets
-        raw_skills = re.split(r"[\n,|/]+", skills_text)
+    if skills_lines:
+        # split each line on commas/bullets
+        raw_skills = [s for ln in skills_lines for s in _SKILL_SPLIT_RE.split(ln)]
         for s in raw_skills:
             item = _clean_bullet(s)
             if not item:
@@ -253,23 +352,19 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                         if item:
                             skills.append(item)
 
-    # Deduplicate skills
-    dedup = []
-    seen = set()
+    # Deduplicate skills case-insensitively, keeping the first spelling
+    unique_skills: Dict[str, str] = {}
     for s in skills:
-        key = s.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        dedup.append(s)
-    skills = dedup[:30]
+        unique_skills.setdefault(s.lower(), s)
+        if len(unique_skills) == MAX_SKILLS:
+            break
+    skills = list(unique_skills.values())
 
     # Experience: parse by company/role with bullets
-    exp_text = sections.get("experience") or ""
+    exp_lines = sections.get("experience") or []
     experience: List[Dict[str, Any]] = []
     
-    if exp_text:
-        exp_lines = _split_lines(exp_text)
+    if exp_lines:
         current_company = ""
         current_role = ""
         current_location = ""
@@ -277,16 +372,14 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
         current_end_date = ""
         current_bullets: List[str] = []
         
-        action_verbs = r"\b(built|developed|led|designed|implemented|improved|reduced|increased|optimized|migrated|engineered|created|managed|coordinated|established|delivered|achieved|accelerated|innovated|integrated|automated|scaled|streamlined|enhanced)\b"
-        
         for ln in exp_lines:
             # Skip headings
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             
             # Check if line is a company/role header (has dates like "2022-Present" or "Jan 2022")
-            has_date = re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4}|present)\b", ln, re.IGNORECASE)
-            has_location = re.search(r"\w+,\s*\w+", ln)
+            has_date = _JOB_DATE_RE.search(ln)
+            has_location = _LOCATION_HINT_RE.search(ln)
             
             # If line has dates and is short-ish, likely a job header
             if has_date and len(ln) < 150:
@@ -298,7 +391,7 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                         "start_date": current_start_date,
                         "end_date": current_end_date,
                         "location": current_location,
-                        "bullets": current_bullets[:15],
+                        "bullets": current_bullets,
                         "is_current": "present" in current_end_date.lower()
                     })
                 
@@ -307,20 +400,20 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 
                 # Parse new job header
                 # Pattern: "Company — Role" or "Role at Company" or just "Company"
-                parts = re.split(r"[—–-]{2,}|\sat\s", ln)
+                parts = _ROLE_SPLIT_RE.split(ln)
                 if len(parts) >= 2:
                     current_company = parts[0].strip()
                     current_role = parts[1].split("|")[0].strip()
                 else:
                     # Try to extract company (before location/date)
                     if has_location:
-                        current_company = re.split(r"[,|]", ln)[0].strip()
+                        current_company = _COMMA_PIPE_RE.split(ln)[0].strip()
                     else:
                         current_company = ln.split("|")[0].strip()
                     current_role = ""
                 
                 if has_location:
-                    loc_match = re.search(r"([\w\s]+,\s*[\w\s]+)", ln)
+                    loc_match = _LOCATION_SPAN_RE.search(ln)
                     if loc_match:
                         current_location = loc_match.group(1).strip()
                 
@@ -328,6 +421,10 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 current_bullets = []
                 continue
             
+            # This job is full; later lines can only be more bullets
+            if len(current_bullets) >= MAX_BULLETS_PER_JOB:
+                continue
+            
             # Otherwise, it's a bullet point
             cleaned = _clean_bullet(ln)
             if not cleaned:
@@ -338,10 +435,9 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 continue
             
             # Must have action verb or be a bullet-formatted line
-            is_bullet = re.match(r"^[\-•●◆■◦*]", ln.strip())
-            has_action = re.search(action_verbs, cleaned, re.IGNORECASE)
+            is_bullet = ln.startswith(_BULLET_PREFIXES)
             
-            if is_bullet or has_action:
+            if is_bullet or not _ACTION_VERBS.isdisjoint(_WORD_RE.findall(cleaned.lower())):
                 current_bullets.append(cleaned)
         
         # Save last job
@@ -352,20 +448,21 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 "start_date": current_start_date,
                 "end_date": current_end_date,
                 "location": current_location,
-                "bullets": current_bullets[:15],
+                "bullets": current_bullets,
                 "is_current": "present" in current_end_date.lower() if current_end_date else False
             })
     
     # Fallback: if no structured experience found, extract all bullets generically
-    if not experience and exp_text:
-        exp_lines = _split_lines(exp_text)
+    if not experience and exp_lines:
         bullets: List[str] = []
         for ln in exp_lines:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             cleaned = _clean_bullet(ln)
             if len(cleaned) >= 40:
                 bullets.append(cleaned)
+                if len(bullets) == MAX_FALLBACK_BULLETS:
+                    break
         
         if bullets:
             experience.append({
@@ -374,15 +471,14 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 "start_date": "",
                 "end_date": "",
                 "location": "",
-                "bullets": bullets[:25],
+                "bullets": bullets,
                 "is_current": False
             })
 
     # Education parsing
     education: List[Dict[str, Any]] = []
-    edu_text = sections.get("education") or ""
-    if edu_text:
-        edu_lines = _split_lines(edu_text)
+    edu_lines = sections.get("education") or []
+    if edu_lines:
         current_institution = ""
         current_degree = ""
         current_field = ""
@@ -392,7 +488,7 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
         gpa = ""
         
         for ln in edu_lines:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             
             # Check if line has dates (likely institution header)
@@ -413,11 +509,11 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 # Parse new education entry
                 start_date, end_date = dates
                 # Extract institution (usually before location or dates)
-                parts = re.split(r'[,|]', ln)
+                parts = _COMMA_PIPE_RE.split(ln)
                 current_institution = parts[0].strip() if parts else ln.strip()
                 
                 # Try to extract location
-                loc_match = re.search(r'([\w\s]+,\s*[\w\s]+)', ln)
+                loc_match = _LOCATION_SPAN_RE.search(ln)
                 if loc_match:
                     current_location = loc_match.group(1).strip()
                 
@@ -427,19 +523,18 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
                 continue
             
             # Check for GPA
-            gpa_match = re.search(r'GPA:?\s*(\d+\.\d+|\d+/\d+)', ln, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(ln)
             if gpa_match:
                 gpa = gpa_match.group(1)
                 continue
             
             # Check for degree patterns (Bachelor, Master, PhD, etc.)
-            degree_keywords = r'\b(Bachelor|Master|MBA|PhD|B\.S\.|M\.S\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech|B\.E\.|M\.E\.)\b'
-            if re.search(degree_keywords, ln, re.IGNORECASE):
+            if _DEGREE_RE.search(ln):
                 # This line likely contains degree and field
                 current_degree = ln.strip()
                 # Try to split degree and field (e.g., "Bachelor of Science in Computer Science")
                 if " in " in ln.lower():
-                    parts = re.split(r'\s+in\s+', ln, flags=re.IGNORECASE)
+                    parts = _IN_SPLIT_RE.split(ln)
                     current_degree = parts[0].strip()
                     current_field = parts[1].strip() if len(parts) > 1 else ""
                 continue
@@ -458,15 +553,14 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
     
     # Projects parsing
     projects: List[Dict[str, Any]] = []
-    projects_text = sections.get("projects") or ""
-    if projects_text:
-        project_lines = _split_lines(projects_text)
+    project_lines = sections.get("projects") or []
+    if project_lines:
         current_project = ""
         current_description = []
         current_tech = []
         
         for ln in project_lines:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             
             # Project name is usually bold/standalone short line or has dates
@@ -490,9 +584,9 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
             # Check for tech stack line
             if "technologies" in ln.lower() or "tech stack" in ln.lower() or "built with" in ln.lower():
                 # Extract technologies
-                tech_part = re.split(r':', ln, 1)
+                tech_part = ln.split(":", 1)
                 if len(tech_part) > 1:
-                    current_tech = [t.strip() for t in re.split(r'[,|/]', tech_part[1]) if t.strip()]
+                    current_tech = [t.strip() for t in _TECH_SPLIT_RE.split(tech_part[1]) if t.strip()]
                 continue
             
             # Otherwise it's description
@@ -511,17 +605,16 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
     
     # Certifications parsing
     certifications: List[Dict[str, Any]] = []
-    cert_text = sections.get("certifications") or ""
-    if cert_text:
-        cert_lines = _split_lines(cert_text)
+    cert_lines = sections.get("certifications") or []
+    if cert_lines:
         for ln in cert_lines:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             cleaned = _clean_bullet(ln)
             if cleaned and len(cleaned) > 5:
                 # Extract cert name and issuer
                 # Pattern: "Cert Name - Issuer" or "Cert Name, Issuer"
-                parts = re.split(r'[-–—,|]', cleaned, 1)
+                parts = _CERT_SPLIT_RE.split(cleaned, 1)
                 cert_name = parts[0].strip()
                 issuer = parts[1].strip() if len(parts) > 1 else ""
                 
@@ -538,25 +631,24 @@ def heuristic_extract_resume_info(raw_text: str) -> Dict[str, Any]:
     
     # Languages parsing
     languages: List[str] = []
-    lang_text = sections.get("languages") or ""
-    if lang_text:
+    lang_lines = sections.get("languages") or []
+    if lang_lines:
         # Split on common delimiters
-        lang_items = re.split(r'[,\n|/]+', lang_text)
+        lang_items = [item for ln in lang_lines for item in _LANG_SPLIT_RE.split(ln)]
         for item in lang_items:
             cleaned = _clean_bullet(item)
             # Remove proficiency levels
-            cleaned = re.sub(r'\(.*?\)', '', cleaned).strip()
-            cleaned = re.sub(r'\b(native|fluent|proficient|intermediate|basic|elementary)\b', '', cleaned, flags=re.IGNORECASE).strip()
+            cleaned = _PARENS_RE.sub('', cleaned).strip()
+            cleaned = _PROFICIENCY_RE.sub('', cleaned).strip()
             if cleaned and len(cleaned) > 2 and len(cleaned) < 30:
                 languages.append(cleaned)
     
     # Awards/Honors parsing (bonus)
     awards: List[str] = []
-    awards_text = sections.get("awards") or ""
-    if awards_text:
-        award_lines = _split_lines(awards_text)
+    award_lines = sections.get("awards") or []
+    if award_lines:
         for ln in award_lines:
-            if _is_heading(ln):
+            if ln in headings:
                 continue
             cleaned = _clean_bullet(ln)
             if cleaned and len(cleaned) > 5:
@@ -585,22 +677,58 @@ async def parse_resume_file(file: UploadFile) -> Dict[str, Any]:
     Parses PDF/DOCX resume and extracts structured data.
     Returns normalized JSON structure.
     """
-    # Extract text from file
-    text = ""
     filename = file.filename or ""
     file_extension = filename.split(".")[-1].lower() if "." in filename else ""
     
-    content = await file.read()
-    # Reset cursor so downstream code can read/save the file again
+    # The extractors read the upload's spooled file directly instead of a
+    # second in-memory copy of the body. Text extraction and heuristics are
+    # CPU-bound; keep them off the event loop
     try:
-        await file.seek(0)
-    except Exception:
-        pass
+        return await asyncio.to_thread(parse_resume_stream, file.file, file_extension)
+    finally:
+        # Reset cursor so downstream code can read/save the file again
+        try:
+            await file.seek(0)
+        except Exception:
+            pass
+
+def parse_resume_stream(stream: BinaryIO, file_extension: str) -> Dict[str, Any]:
+    """
+    Synchronous core of parse_resume_file for a seekable binary file object.
+    Identical uploads are served from an in-process LRU cache.
+    """
+    key = f"{file_extension}:{_content_digest(stream)}"
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+    if cached is not None:
+        return pickle.loads(cached)
+    
+    normalized_data = _parse_resume_stream_uncached(stream, file_extension)
+    # Snapshot before returning, since callers may mutate the result
+    # (e.g. before persisting it)
+    snapshot = pickle.dumps(normalized_data, pickle.HIGHEST_PROTOCOL)
     
+    with _parse_cache_lock:
+        _parse_cache[key] = snapshot
+        _parse_cache.move_to_end(key)
+        if len(_parse_cache) > PARSE_CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
+    return normalized_data
+
+def _content_digest(stream: BinaryIO) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    stream.seek(0)
+    for chunk in iter(partial(stream.read, HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def _parse_resume_stream_uncached(stream: BinaryIO, file_extension: str) -> Dict[str, Any]:
     if file_extension == "pdf":
-        text = extract_text_from_pdf(content)
+        text = extract_text_from_pdf(stream)
     elif file_extension in ["docx", "doc"]:
-        text = extract_text_from_docx(content)
+        text = extract_text_from_docx(stream)
     else:
         raise ValueError("Unsupported file format. Please upload PDF or DOCX.")
     
@@ -608,38 +736,58 @@ async def parse_resume_file(file: UploadFile) -> Dict[str, Any]:
     # If OpenAI is configured, we can enhance it later, but we start with real data.
     structured_data = heuristic_extract_resume_info(text)
     
+    # Only the head of the document is kept from here on; drop the rest now
+    text = text[:RAW_TEXT_MAX_CHARS]
+    
     # Post-process and normalize
     normalized_data = normalize_resume_structure(structured_data, text)
     
     return normalized_data
 
-def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF bytes."""
+@lru_cache(maxsize=None)
+def _pdf_backend() -> Tuple[Any, Any]:
+    """
+    (fitz, PdfReader), imported on first use so workers that never see a
+    PDF don't pay for them. PyMuPDF extracts text several times faster and
+    is used when installed; otherwise pypdf, the maintained successor of
+    PyPDF2 (same PdfReader API).
+    """
+    try:
+        import fitz
+        return fitz, None
+    except ImportError:
+        pass
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+    return None, PdfReader
+
+def extract_text_from_pdf(stream: BinaryIO) -> str:
+    """Extract text from a PDF file object."""
     try:
-        import io
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        fitz, PdfReader = _pdf_backend()
+        stream.seek(0)
+        if fitz is not None:
+            # MuPDF needs the document as one bytes object
+            with fitz.open(stream=stream.read(), filetype="pdf") as doc:
+                return "\n".join(page.get_text("text") for page in doc).strip()
         
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        pdf_reader = PdfReader(stream)
         
-        return text.strip()
+        return "\n".join(page.extract_text() or "" for page in pdf_reader.pages).strip()
     except Exception as e:
         raise ValueError(f"Error parsing PDF: {str(e)}")
 
-def extract_text_from_docx(content: bytes) -> str:
-    """Extract text from DOCX bytes."""
+def extract_text_from_docx(stream: BinaryIO) -> str:
+    """Extract text from a DOCX file object."""
     try:
-        import io
-        docx_file = io.BytesIO(content)
-        doc = Document(docx_file)
+        from docx import Document
         
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        stream.seek(0)
+        doc = Document(stream)
         
-        return text.strip()
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
     except Exception as e:
         raise ValueError(f"Error parsing DOCX: {str(e)}")
 
@@ -666,55 +814,35 @@ def normalize_resume_structure(ai_output: Dict[str, Any], raw_text: str) -> Dict
         "languages": ai_output.get("languages", []),
         "awards": ai_output.get("awards", []),
         "sections_order": ["personal_info", "summary", "experience", "education", "skills", "projects", "certifications", "languages", "awards"],
-        "raw_text": raw_text[:5000]  # Store first 5000 chars for reference
+        "raw_text": raw_text[:RAW_TEXT_MAX_CHARS]  # Store the start of the text for reference
     }
 
 def extract_email(text: str) -> str:
     """Extract email using regex."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else ""
 
 def extract_phone(text: str) -> str:
     """Extract phone number using regex."""
-    phone_pattern = r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]'
-    match = re.search(phone_pattern, text)
+    match = _PHONE_RE.search(text)
     return match.group(0) if match else ""
 
-def extract_sections(text: str) -> Dict[str, str]:
+def extract_sections(lines: List[str]) -> Dict[str, List[str]]:
     """
     Heuristic section detection.
-    Looks for common section headers.
+    Looks for common section headers in already-split lines (see _split_lines)
+    and returns each section's lines.
     """
-    sections = {}
-    
-    # Common section headers
-    headers = SECTION_HEADERS
-    
-    lines = text.split("\n")
-    current_section = None
-    section_content = []
+    # A repeated header starts its section over
+    sections: Dict[str, List[str]] = {}
+    section_content = None
     
     for line in lines:
-        line_lower = line.lower().strip()
-        
-        # Check if line is a section header
-        for section_name, keywords in headers.items():
-            if any(keyword == line_lower for keyword in keywords):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = "\n".join(section_content)
-                
-                current_section = section_name
-                section_content = []
-                break
-        else:
-            if current_section:
-                section_content.append(line)
-    
-    # Save last section
-    if current_section:
-        sections[current_section] = "\n".join(section_content)
+        section_name = _HEADER_TO_SECTION.get(line.lower())
+        if section_name is not None:
+            section_content = sections[section_name] = []
+        elif section_content is not None:
+            section_content.append(line)
     
     return sections
 
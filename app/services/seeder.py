@@ -1,7 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
 import json
 import os
 from app.models.all_models import Template
+from app.services.template_recommender import invalidate_template_cache
+
+# orjson parses template files faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Template files are small; reading them concurrently overlaps the file IO
+TEMPLATE_LOAD_WORKERS = 8
+
+
+def _load_template(path: str) -> dict:
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
 
 def seed_templates(db: Session):
     """
@@ -16,25 +35,45 @@ def seed_templates(db: Session):
 
     print(f"Seeding templates from: {template_dir}")
     
-    for filename in os.listdir(template_dir):
-        if filename.endswith(".json"):
+    with os.scandir(template_dir) as entries:
+        files = [(e.name, e.path) for e in entries if e.name.endswith(".json") and e.is_file()]
+
+    parsed = []
+    with ThreadPoolExecutor(max_workers=TEMPLATE_LOAD_WORKERS) as pool:
+        loads = [(filename, pool.submit(_load_template, path)) for filename, path in files]
+        for filename, load in loads:
             try:
-                with open(os.path.join(template_dir, filename), 'r') as f:
-                    data = json.load(f)
-                    # Check if exists
-                    existing = db.query(Template).filter(Template.name == data['name']).first()
-                    if not existing:
-                        print(f"Creating template: {data['name']}")
-                        db_template = Template(
-                            name=data['name'],
-                            category=data['category'],
-                            config_json=data,
-                            preview_image_url=f"/static/templates/{filename.replace('.json', '.png')}"
-                        )
-                        db.add(db_template)
-                    else:
-                        print(f"Template already exists: {data['name']}")
+                data = load.result()
+                parsed.append((filename, data, data['name']))
             except Exception as e:
                 print(f"Error seeding {filename}: {e}")
-                
+
+    # One existence query for the whole batch instead of one per file
+    names = [name for _, _, name in parsed]
+    existing_names = {
+        name for (name,) in db.query(Template.name).filter(Template.name.in_(names))
+    }
+
+    new_templates = []
+    for filename, data, name in parsed:
+        if name in existing_names:
+            print(f"Template already exists: {name}")
+            continue
+        try:
+            db_template = Template(
+                name=name,
+                category=data['category'],
+                config_json=data,
+                preview_image_url=f"/static/templates/{filename.replace('.json', '.png')}"
+            )
+        except Exception as e:
+            print(f"Error seeding {filename}: {e}")
+            continue
+        print(f"Creating template: {name}")
+        new_templates.append(db_template)
+        # Two files declaring the same name would violate the unique constraint
+        existing_names.add(name)
+
+    db.add_all(new_templates)
     db.commit()
+    invalidate_template_cache()
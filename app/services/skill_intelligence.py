@@ -8,15 +8,19 @@ Provides:
 - Gap analysis
 - High-ROI skill recommendations
 """
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Set, Tuple
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+import heapq
 import re
 from datetime import datetime
+from types import MappingProxyType
 
 from app.domain.entities.skill import (
     Skill, SkillCategory, SkillLevel, SkillEvidence, EvidenceType,
     SkillGap, SkillProfile, normalize_skill_name, get_skill_category,
-    SKILL_ALIASES
+    SKILL_ALIASES, SKILL_CATEGORIES
 )
 from app.domain.entities.resume import ResumeEntity, ResumeBullet
 from app.domain.entities.job import JobDescriptionEntity, JobSkill
@@ -35,6 +39,11 @@ HIGH_DEMAND_SKILLS = {
     "soft_skill": ["Communication", "Leadership", "Problem Solving", "Collaboration"]
 }
 
+# Every high-demand skill regardless of category, for membership tests
+_HIGH_DEMAND_SET: FrozenSet[str] = frozenset(
+    skill for skills in HIGH_DEMAND_SKILLS.values() for skill in skills
+)
+
 # Skills that are transferable across industries
 TRANSFERABLE_SKILLS = {
     "Python", "JavaScript", "SQL", "Git", "Docker",
@@ -58,6 +67,76 @@ ACTION_VERBS = {
     "analyzed", "improved", "reduced", "increased", "achieved"
 }
 
+# Any action verb as a plain substring (same test as checking each verb with
+# `in`), plus a digit check for metrics, each done in one C-level scan
+_ACTION_VERB_RE = re.compile("|".join(map(re.escape, sorted(ACTION_VERBS))))
+_DIGIT_RE = re.compile(r"\d")
+
+# SKILL_HIERARCHY keyed by lowercased parent, each mapping lowercased child
+# names to their display form, so lookups need no per-call lowercasing
+_SKILL_HIERARCHY_LOWER: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    parent.lower(): MappingProxyType({child.lower(): child for child in children})
+    for parent, children in SKILL_HIERARCHY.items()
+})
+
+
+def _build_partial_matches() -> Mapping[str, Tuple[Tuple[str, Tuple[str, str]], ...]]:
+    """
+    Index SKILL_HIERARCHY both ways for _find_partial_match: each lowercased
+    skill maps to (user skill that satisfies it, match result) pairs, in the
+    order a scan of the hierarchy would try them.
+    """
+    index: Dict[str, List[Tuple[str, Tuple[str, str]]]] = {}
+    for parent, children in SKILL_HIERARCHY.items():
+        parent_lower = parent.lower()
+        children_lower = [c.lower() for c in children]
+        # Required parent: the user has a child skill
+        index.setdefault(parent_lower, []).extend(
+            (child, (child, f"Related skill (knows {child})")) for child in children_lower
+        )
+        # Required child: the user has the parent skill
+        for child in children_lower:
+            index.setdefault(child, []).append(
+                (parent_lower, (parent, f"Has foundation ({parent})"))
+            )
+    return MappingProxyType({skill: tuple(pairs) for skill, pairs in index.items()})
+
+
+_PARTIAL_MATCHES = _build_partial_matches()
+
+# Reverse lookup for skill aliases, built once rather than per engine
+_ALIAS_LOOKUP: Mapping[str, str] = MappingProxyType({
+    alias.lower(): canonical for alias, canonical in SKILL_ALIASES.items()
+})
+
+
+def _word_pattern(term: str) -> "re.Pattern[str]":
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+# (lowercase term, word-boundary pattern, skill name) for every known alias
+# and categorised skill, compiled once for free-text extraction
+_TEXT_SKILL_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]", str], ...] = tuple(
+    (alias, _word_pattern(alias), canonical)
+    for alias, canonical in _ALIAS_LOOKUP.items()
+) + tuple(
+    (skill_name.lower(), _word_pattern(skill_name.lower()), skill_name)
+    for skill_name in SKILL_CATEGORIES
+)
+
+
+# Memoized: the same bullets and job descriptions are analyzed repeatedly
+@lru_cache(maxsize=4096)
+def _skills_in_text(text_lower: str) -> FrozenSet[str]:
+    """Known skill names mentioned in lowercased text"""
+    # Matched on word boundaries to avoid partial matches. The substring test
+    # is a cheap precondition that skips the regex for absent terms
+    return frozenset(
+        skill_name
+        for term, pattern, skill_name in _TEXT_SKILL_PATTERNS
+        if term in text_lower and pattern.search(text_lower)
+    )
+
 
 @dataclass
 class SkillMatch:
@@ -89,10 +168,7 @@ class SkillIntelligenceEngine:
         """
         self._ai = ai_orchestrator
         
-        # Build reverse lookup for skill aliases
-        self._alias_lookup: Dict[str, str] = {}
-        for alias, canonical in SKILL_ALIASES.items():
-            self._alias_lookup[alias.lower()] = canonical
+        self._alias_lookup: Mapping[str, str] = _ALIAS_LOOKUP
     
     # =========================================================================
     # SKILL EXTRACTION
@@ -112,19 +188,20 @@ class SkillIntelligenceEngine:
         
         # 1. Extract from explicit skills list
         for skill_text in resume.skills:
-            skill = self._create_skill(
+            self._merge_skill(
+                all_skills,
                 skill_text,
                 evidence_type=EvidenceType.LISTED,
                 source_section="skills"
             )
-            self._merge_skill(all_skills, skill)
         
         # 2. Extract from experience bullets
         for i, exp in enumerate(resume.experience):
             for bullet in exp.bullets:
                 extracted = self._extract_skills_from_text(bullet.text)
                 for skill_name in extracted:
-                    skill = self._create_skill(
+                    self._merge_skill(
+                        all_skills,
                         skill_name,
                         evidence_type=EvidenceType.EXPERIENCE,
                         source_section="experience",
@@ -133,43 +210,42 @@ class SkillIntelligenceEngine:
                         role=exp.role,
                         years_ago=i  # Rough estimate based on position
                     )
-                    self._merge_skill(all_skills, skill)
         
         # 3. Extract from projects
         for proj in resume.projects:
             # Tech stack is explicit
             for tech in proj.tech_stack:
-                skill = self._create_skill(
+                self._merge_skill(
+                    all_skills,
                     tech,
                     evidence_type=EvidenceType.PROJECT,
                     source_section="projects",
                     source_text=f"Project: {proj.name}"
                 )
-                self._merge_skill(all_skills, skill)
             
             # Also check bullets
             for bullet in proj.bullets:
                 extracted = self._extract_skills_from_text(bullet.text)
                 for skill_name in extracted:
-                    skill = self._create_skill(
+                    self._merge_skill(
+                        all_skills,
                         skill_name,
                         evidence_type=EvidenceType.PROJECT,
                         source_section="projects",
                         source_text=bullet.text
                     )
-                    self._merge_skill(all_skills, skill)
         
         # 4. Extract from certifications
         for cert in resume.certifications:
             extracted = self._extract_skills_from_text(cert)
             for skill_name in extracted:
-                skill = self._create_skill(
+                self._merge_skill(
+                    all_skills,
                     skill_name,
                     evidence_type=EvidenceType.CERTIFICATION,
                     source_section="certifications",
                     source_text=cert
                 )
-                self._merge_skill(all_skills, skill)
         
         # Enrich with market data
         skills = list(all_skills.values())
@@ -179,24 +255,7 @@ class SkillIntelligenceEngine:
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skill names from free text"""
-        found_skills = []
-        text_lower = text.lower()
-        
-        # Check against known skill aliases
-        for alias, canonical in self._alias_lookup.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(alias) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(canonical)
-        
-        # Also check for skills in our category list
-        from app.domain.entities.skill import SKILL_CATEGORIES
-        for skill_name in SKILL_CATEGORIES.keys():
-            pattern = r'\b' + re.escape(skill_name.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill_name)
-        
-        return list(set(found_skills))
+        return list(_skills_in_text(text.lower()))
     
     def _create_skill(
         self,
@@ -210,16 +269,11 @@ class SkillIntelligenceEngine:
     ) -> Skill:
         """Create a Skill entity with evidence"""
         normalized = normalize_skill_name(skill_text)
-        category = get_skill_category(skill_text)
+        # Same as get_skill_category(skill_text) without normalizing twice
+        category = SKILL_CATEGORIES.get(normalized, SkillCategory.OTHER)
         
-        evidence = SkillEvidence(
-            evidence_type=evidence_type,
-            source_section=source_section,
-            source_text=source_text,
-            company=company,
-            role=role,
-            years_ago=years_ago,
-            confidence=self._calculate_evidence_confidence(evidence_type, source_text)
+        evidence = self._create_evidence(
+            evidence_type, source_section, source_text, company, role, years_ago
         )
         
         skill = Skill(
@@ -232,6 +286,26 @@ class SkillIntelligenceEngine:
         
         return skill
     
+    def _create_evidence(
+        self,
+        evidence_type: EvidenceType,
+        source_section: str,
+        source_text: Optional[str] = None,
+        company: Optional[str] = None,
+        role: Optional[str] = None,
+        years_ago: Optional[int] = None
+    ) -> SkillEvidence:
+        """Create a SkillEvidence record with its confidence score"""
+        return SkillEvidence(
+            evidence_type=evidence_type,
+            source_section=source_section,
+            source_text=source_text,
+            company=company,
+            role=role,
+            years_ago=years_ago,
+            confidence=self._calculate_evidence_confidence(evidence_type, source_text)
+        )
+    
     def _calculate_evidence_confidence(
         self, 
         evidence_type: EvidenceType,
@@ -251,24 +325,42 @@ class SkillIntelligenceEngine:
         
         # Boost confidence if source text shows actual usage
         if source_text:
-            text_lower = source_text.lower()
-            if any(verb in text_lower for verb in ACTION_VERBS):
+            if _ACTION_VERB_RE.search(source_text.lower()):
                 confidence = min(1.0, confidence + 0.10)
-            if any(char.isdigit() for char in source_text):
+            if _DIGIT_RE.search(source_text):
                 # Has metrics
                 confidence = min(1.0, confidence + 0.05)
         
         return confidence
     
-    def _merge_skill(self, skills_dict: Dict[str, Skill], new_skill: Skill):
-        """Merge skill evidence if skill already exists"""
-        key = new_skill.normalized_name.lower()
+    def _merge_skill(
+        self,
+        skills_dict: Dict[str, Skill],
+        skill_text: str,
+        evidence_type: EvidenceType,
+        source_section: str,
+        source_text: Optional[str] = None,
+        company: Optional[str] = None,
+        role: Optional[str] = None,
+        years_ago: Optional[int] = None
+    ):
+        """
+        Record a skill mention. Evidence is added to an existing skill; the
+        Skill entity is only built on the first mention.
+        """
+        key = normalize_skill_name(skill_text).lower()
+        existing = skills_dict.get(key)
         
-        if key in skills_dict:
+        if existing is not None:
             # Add evidence to existing skill
-            skills_dict[key].evidence.extend(new_skill.evidence)
+            existing.evidence.append(self._create_evidence(
+                evidence_type, source_section, source_text, company, role, years_ago
+            ))
         else:
-            skills_dict[key] = new_skill
+            skills_dict[key] = self._create_skill(
+                skill_text, evidence_type, source_section,
+                source_text, company, role, years_ago
+            )
     
     def _enrich_skills_with_market_data(self, skills: List[Skill]):
         """Add market intelligence data to skills"""
@@ -276,10 +368,7 @@ class SkillIntelligenceEngine:
             normalized = skill.normalized_name
             
             # Check if trending
-            skill.is_trending = any(
-                normalized in skills_list 
-                for skills_list in HIGH_DEMAND_SKILLS.values()
-            )
+            skill.is_trending = normalized in _HIGH_DEMAND_SET
             
             # Set demand level
             if skill.is_trending:
@@ -308,11 +397,13 @@ class SkillIntelligenceEngine:
         partial = []
         missing = []
         
-        user_skill_names = {s.normalized_name.lower() for s in user_skills}
         user_skill_lookup = {s.normalized_name.lower(): s for s in user_skills}
+        user_skill_names = user_skill_lookup.keys()
         
         for required in required_skills:
-            normalized_req = normalize_skill_name(required).lower()
+            # Normalized once; the display form is reused for missing skills
+            normalized = normalize_skill_name(required)
+            normalized_req = normalized.lower()
             
             # Direct match
             if normalized_req in user_skill_names:
@@ -341,7 +432,7 @@ class SkillIntelligenceEngine:
             # No match
             missing.append(SkillMatch(
                 skill_name=required,
-                normalized_name=normalize_skill_name(required),
+                normalized_name=normalized,
                 matched=False,
                 match_reason="Not found in resume"
             ))
@@ -355,19 +446,9 @@ class SkillIntelligenceEngine:
     ) -> Optional[Tuple[str, str]]:
         """Find partial/related skill match"""
         # Check skill hierarchy
-        for parent, children in SKILL_HIERARCHY.items():
-            children_lower = [c.lower() for c in children]
-            
-            if required_skill == parent.lower():
-                # User has a child skill
-                for child in children_lower:
-                    if child in user_skills:
-                        return (child, f"Related skill (knows {child})")
-            
-            if required_skill in children_lower:
-                # User has parent skill
-                if parent.lower() in user_skills:
-                    return (parent, f"Has foundation ({parent})")
+        for related, match in _PARTIAL_MATCHES.get(required_skill, ()):
+            if related in user_skills:
+                return match
         
         return None
     
@@ -392,6 +473,7 @@ class SkillIntelligenceEngine:
         preferred_skills = [s.name for s in job.preferred_skills]
         
         matched, partial, missing = self.match_skills(user_skills, required_skills)
+        user_skill_names = {s.normalized_name.lower() for s in user_skills}
         
         # Create gaps for missing skills
         for miss in missing:
@@ -411,7 +493,7 @@ class SkillIntelligenceEngine:
                 required_level=SkillLevel.INTERMEDIATE,
                 is_learnable=True,
                 learning_time_estimate=self._estimate_learning_time(miss.normalized_name),
-                alternative_skills=self._find_alternatives(miss.normalized_name, user_skills),
+                alternative_skills=self._find_alternatives(miss.normalized_name, user_skill_names),
                 priority_score=self._calculate_gap_priority(importance, miss.normalized_name)
             )
             gaps.append(gap)
@@ -456,23 +538,25 @@ class SkillIntelligenceEngine:
     def _find_alternatives(
         self, 
         skill_name: str,
-        user_skills: List[Skill]
+        user_skill_names: Set[str]
     ) -> List[str]:
-        """Find alternative skills the user has"""
+        """Find alternative skills the user has (user_skill_names are lowercased)"""
         alternatives = []
+        skill_lower = skill_name.lower()
         
         # Check hierarchy for related skills
-        for parent, children in SKILL_HIERARCHY.items():
-            if skill_name.lower() == parent.lower():
-                for child in children:
-                    if any(s.normalized_name.lower() == child.lower() for s in user_skills):
-                        alternatives.append(child)
-            elif skill_name.lower() in [c.lower() for c in children]:
+        for parent_lower, children in _SKILL_HIERARCHY_LOWER.items():
+            if skill_lower == parent_lower:
+                alternatives.extend(
+                    child for child_lower, child in children.items()
+                    if child_lower in user_skill_names
+                )
+            elif skill_lower in children:
                 # Check if user has other siblings
-                for child in children:
-                    if child.lower() != skill_name.lower():
-                        if any(s.normalized_name.lower() == child.lower() for s in user_skills):
-                            alternatives.append(child)
+                alternatives.extend(
+                    child for child_lower, child in children.items()
+                    if child_lower != skill_lower and child_lower in user_skill_names
+                )
         
         return alternatives[:3]  # Limit to 3
     
@@ -489,7 +573,7 @@ class SkillIntelligenceEngine:
         
         # Boost if skill is trending
         normalized = normalize_skill_name(skill_name)
-        if any(normalized in skills for skills in HIGH_DEMAND_SKILLS.values()):
+        if normalized in _HIGH_DEMAND_SET:
             priority = min(1.0, priority + 0.15)
         
         return priority
@@ -514,44 +598,39 @@ class SkillIntelligenceEngine:
         - Learning investment vs. impact
         """
         user_skill_names = {s.normalized_name.lower() for s in user_skills}
+        user_names = {s.normalized_name for s in user_skills}
         recommendations = []
         
-        # Collect candidate skills from high-demand lists
-        candidates = set()
-        for skills in HIGH_DEMAND_SKILLS.values():
-            candidates.update(skills)
-        
-        # Filter out skills user already has
-        candidates = {s for s in candidates if s.lower() not in user_skill_names}
+        # Candidates are the high-demand skills the user doesn't already have
+        candidates = {s for s in _HIGH_DEMAND_SET if s.lower() not in user_skill_names}
         
         for skill_name in candidates:
             # Calculate ROI score
-            roi_score = self._calculate_skill_roi(skill_name, user_skills, target_role)
+            roi_score = self._calculate_skill_roi(skill_name, user_skill_names, target_role)
             
             recommendations.append({
                 "skill": skill_name,
                 "category": get_skill_category(skill_name).value,
                 "roi_score": roi_score,
                 "learning_time": self._estimate_learning_time(skill_name),
-                "synergy_with": self._find_synergies(skill_name, user_skills),
+                "synergy_with": self._find_synergies(skill_name, user_names),
                 "why_valuable": self._explain_value(skill_name, target_role)
             })
         
-        # Sort by ROI and return top N
-        recommendations.sort(key=lambda r: r["roi_score"], reverse=True)
-        return recommendations[:limit]
+        # Top N by ROI
+        return heapq.nlargest(limit, recommendations, key=lambda r: r["roi_score"])
     
     def _calculate_skill_roi(
         self,
         skill_name: str,
-        user_skills: List[Skill],
+        user_skill_names: Set[str],
         target_role: Optional[str]
     ) -> float:
-        """Calculate return on investment for learning a skill"""
+        """Calculate return on investment for learning a skill (user_skill_names are lowercased)"""
         roi = 0.5  # Base
         
         # High demand bonus
-        if any(skill_name in skills for skills in HIGH_DEMAND_SKILLS.values()):
+        if skill_name in _HIGH_DEMAND_SET:
             roi += 0.2
         
         # Transferability bonus
@@ -561,18 +640,17 @@ class SkillIntelligenceEngine:
         # Synergy bonus (builds on existing skills)
         for parent, children in SKILL_HIERARCHY.items():
             if skill_name == parent:
-                if any(c.lower() in {s.normalized_name.lower() for s in user_skills} for c in children):
+                if any(c.lower() in user_skill_names for c in children):
                     roi += 0.15
             elif skill_name in children:
-                if parent.lower() in {s.normalized_name.lower() for s in user_skills}:
+                if parent.lower() in user_skill_names:
                     roi += 0.15
         
         return min(1.0, roi)
     
-    def _find_synergies(self, skill_name: str, user_skills: List[Skill]) -> List[str]:
-        """Find existing skills that synergize with the target skill"""
+    def _find_synergies(self, skill_name: str, user_names: Set[str]) -> List[str]:
+        """Find existing skills (by normalized name) that synergize with the target skill"""
         synergies = []
-        user_names = {s.normalized_name for s in user_skills}
         
         for parent, children in SKILL_HIERARCHY.items():
             if skill_name == parent:
@@ -614,13 +692,12 @@ class SkillIntelligenceEngine:
             skills=skills
         )
         
-        # Determine strongest category
-        category_counts: Dict[SkillCategory, int] = {}
-        for skill in skills:
-            category_counts[skill.category] = category_counts.get(skill.category, 0) + 1
+        # Determine strongest category (Counter tallies in C; most_common
+        # breaks ties by first appearance, as max() over the dict did)
+        category_counts = Counter(skill.category for skill in skills)
         
         if category_counts:
-            profile.strongest_category = max(category_counts, key=category_counts.get)
+            profile.strongest_category = category_counts.most_common(1)[0][0]
         
         # Analyze gaps if job provided
         if target_job:
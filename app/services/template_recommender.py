@@ -1,7 +1,73 @@
-from typing import Dict, List, Any
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from uuid import UUID
 from sqlalchemy.orm import Session
 from app.models.all_models import Template
 
+
+@dataclass(frozen=True)
+class TemplateCandidate:
+    """Immutable snapshot of an active template's scored columns"""
+    id: UUID
+    name: str
+    category: str
+    preview_image_url: Optional[str]
+    target_roles: Tuple[str, ...]
+    target_roles_lower: FrozenSet[str]
+    ats_score: int
+    no_photo: bool
+
+
+# Active templates change rarely (seeding, admin edits), so the query result
+# is reused across requests for this long. Plain snapshots are cached rather
+# than ORM rows, so they are safe to share across sessions and threads, and
+# target roles are lowercased once so scoring does no per-request string work
+TEMPLATE_CACHE_TTL_SECONDS = 60.0
+_active_templates_cache: Tuple[float, Tuple[TemplateCandidate, ...]] = (0.0, ())
+
+
+def invalidate_template_cache() -> None:
+    """Drop the cached active templates so the next call re-queries."""
+    global _active_templates_cache
+    _active_templates_cache = (0.0, ())
+
+
+def _to_candidate(row: Any) -> TemplateCandidate:
+    config = row.config_json
+    target_roles = tuple(config.get("target_roles", []))
+    return TemplateCandidate(
+        id=row.id,
+        name=row.name,
+        category=row.category,
+        preview_image_url=row.preview_image_url,
+        target_roles=target_roles,
+        target_roles_lower=frozenset(r.lower() for r in target_roles),
+        ats_score=config.get("ats_score", 0),
+        no_photo=bool(config.get("regional_rules", {}).get("no_photo"))
+    )
+
+
+def _get_active_templates(db: Session) -> Tuple[TemplateCandidate, ...]:
+    global _active_templates_cache
+    loaded_at, templates = _active_templates_cache
+    now = time.monotonic()
+    if templates and now - loaded_at < TEMPLATE_CACHE_TTL_SECONDS:
+        return templates
+    
+    rows = db.query(
+        Template.id,
+        Template.name,
+        Template.category,
+        Template.preview_image_url,
+        Template.config_json
+    ).filter(Template.is_active == True).all()
+    templates = tuple(_to_candidate(row) for row in rows)
+    _active_templates_cache = (now, templates)
+    return templates
+
+
 class TemplateRecommendationEngine:
     """
     AI-powered template recommendation based on user context.
@@ -18,42 +84,44 @@ class TemplateRecommendationEngine:
         """
         Returns top 3 recommended templates with reasoning.
         """
-        all_templates = db.query(Template).filter(Template.is_active == True).all()
+        all_templates = _get_active_templates(db)
         
-        scored_templates = []
-        for template in all_templates:
-            score = self._calculate_match_score(
-                template,
-                target_role,
-                experience_level,
-                country
-            )
-            scored_templates.append({
-                "template": template,
-                "score": score,
-                "reasoning": self._generate_reasoning(template, target_role, experience_level)
-            })
+        role = target_role.lower()
+        role_matches = [role in template.target_roles_lower for template in all_templates]
+        scores = [
+            self._calculate_match_score(template, role_match, experience_level, country)
+            for template, role_match in zip(all_templates, role_matches)
+        ]
         
-        # Sort by score and return top 3
-        scored_templates.sort(key=lambda x: x["score"], reverse=True)
-        return scored_templates[:3]
+        # Top 3 by score (same order and tie-breaking as a stable sort); only
+        # those need reasoning text
+        top = heapq.nlargest(3, range(len(all_templates)), key=scores.__getitem__)
+        return [
+            {
+                "template": all_templates[i],
+                "score": scores[i],
+                "reasoning": self._generate_reasoning(
+                    all_templates[i], target_role, role_matches[i], experience_level
+                )
+            }
+            for i in top
+        ]
     
     def _calculate_match_score(
         self,
-        template: Template,
-        target_role: str,
+        template: TemplateCandidate,
+        role_match: bool,
         experience_level: str,
         country: str
     ) -> int:
         """
-        Scoring logic based on user context.
+        Scoring logic based on user context. role_match says whether the
+        template lists the user's target role.
         """
         score = 50  # Base score
         
-        config = template.config_json
-        
         # Role matching
-        if target_role.lower() in [r.lower() for r in config.get("target_roles", [])]:
+        if role_match:
             score += 30
         
         # Experience level
@@ -63,31 +131,30 @@ class TemplateRecommendationEngine:
             score += 20
         
         # Country-specific rules
-        if country in ["US", "CA", "UK"] and config.get("regional_rules", {}).get("no_photo"):
+        if country in ["US", "CA", "UK"] and template.no_photo:
             score += 15
         
         # ATS score
-        score += config.get("ats_score", 0) // 5
+        score += template.ats_score // 5
         
         return min(score, 100)
     
     def _generate_reasoning(
         self,
-        template: Template,
+        template: TemplateCandidate,
         target_role: str,
+        role_match: bool,
         experience_level: str
     ) -> str:
         """
         Human-readable explanation for why this template was recommended.
         """
-        config = template.config_json
-        
         reasons = []
         
-        if target_role.lower() in [r.lower() for r in config.get("target_roles", [])]:
+        if role_match:
             reasons.append(f"Optimized for {target_role} roles")
         
-        if config.get("ats_score", 0) >= 95:
+        if template.ats_score >= 95:
             reasons.append("Highest ATS compatibility")
         
         if template.category == "Fresher" and experience_level == "Fresher":